@@ -6,7 +6,7 @@ Almost identical to CaseInsensitiveDict() of requests (https://github.com/psf/re
 
 from __future__ import annotations
 from collections.abc import MutableMapping
-from typing import Any, Generator, Optional, Tuple
+from typing import Any, Generator, Iterable, Optional, Tuple
 
 
 class CaseInsensitiveDict(MutableMapping):
@@ -24,6 +24,20 @@ class CaseInsensitiveDict(MutableMapping):
         for key, value in kwargs.items():
             self.__setitem__(key, value)
 
+    @classmethod
+    def from_dict(cls, values: dict) -> CaseInsensitiveDict:
+        """Bulk construction from a plain dict, bypassing __setitem__ for each key."""
+        obj = cls.__new__(cls)
+        obj._items = {key.casefold(): (key, value) for key, value in values.items()}
+        return obj
+
+    @classmethod
+    def from_pairs(cls, pairs: Iterable[Tuple[str, Any]]) -> CaseInsensitiveDict:
+        """Bulk construction from key/value pairs, e.g. as object_pairs_hook for json."""
+        obj = cls.__new__(cls)
+        obj._items = {key.casefold(): (key, value) for key, value in pairs}
+        return obj
+
     @staticmethod
     def _strip_case(string: str) -> str:
         return string.casefold()
@@ -12,8 +12,13 @@ class CIJSONEncoder(json.JSONEncoder):
             return super().default(obj)
 
 
-def case_insensitive_hook(obj: object) -> object:
-    return cidict.CaseInsensitiveDict(obj)
+def case_insensitive_hook(obj: dict) -> object:
+    return cidict.CaseInsensitiveDict.from_dict(obj)
+
+
+def case_insensitive_pairs_hook(pairs: list) -> object:
+    # Skips the intermediate dict json builds for object_hook
+    return cidict.CaseInsensitiveDict.from_pairs(pairs)
 
 
 def print_json(data):
@@ -21,11 +26,11 @@ def print_json(data):
 
 
 def load(*args, **kwargs):
-    return json.load(*args, **kwargs, object_hook=case_insensitive_hook)
+    return json.load(*args, **kwargs, object_pairs_hook=case_insensitive_pairs_hook)
 
 
 def loads(*args, **kwargs):
-    return json.loads(*args, **kwargs, object_hook=case_insensitive_hook)
+    return json.loads(*args, **kwargs, object_pairs_hook=case_insensitive_pairs_hook)
 
 
 def dump(*args, **kwargs):
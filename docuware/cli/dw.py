@@ -199,6 +199,8 @@ def list_cmd(dw: docuware.Client, args: argparse.Namespace) -> Optional[int]:
 
     def show_org(org):
         print(org)
+        if args.file_cabinet is None:
+            docuware.FileCabinet.prefetch_dialogs(org.file_cabinets)
         for fc in org.file_cabinets:
             show_filecabinet(fc)
 
@@ -4,8 +4,6 @@ from typing import Any, Dict, Generator, Iterator, List, Optional, Tuple, Type,
 
 from docuware import conn, errors, structs, types, utils, organization
 
-import requests
-
 log = logging.getLogger(__name__)
 
 
@@ -15,6 +13,7 @@ class DocuwareClient(types.DocuwareClientP):
         self.endpoints = {}
         self.resources = {}
         self.version = None
+        self._dialog_configs: Dict[str, dict] = {}
 
     @property
     def organizations(self) -> Generator[types.OrganizationP, None, None]:
@@ -56,14 +55,34 @@ class DocuwareClient(types.DocuwareClientP):
             state = auth.login(self.conn)
             self.conn.authenticator = auth
 
+        self._dialog_configs.clear()
+        self.conn.clear_cache()
         res = self.conn.get_json("/DocuWare/Platform")
         self.endpoints = structs.Endpoints(res)
         self.resources = structs.Resources(res)
         self.version = res.get("Version")
         return state or {}
 
+    def dialog_config(self, endpoint: str) -> dict:
+        """Fetch a dialog configuration, repeated requests for the same dialog are served from a cache."""
+        config = self._dialog_configs.get(endpoint)
+        if config is None:
+            config = self.conn.get_json(endpoint)
+            self._dialog_configs[endpoint] = config
+        return config
+
     def logoff(self) -> None:
         if self.conn.authenticator:
             self.conn.authenticator.logoff(self.conn)
 
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> DocuwareClient:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        # No logoff here, a saved session may still be used later
+        self.close()
+
 # vim: set et sw=4 ts=4:
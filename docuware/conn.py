@@ -3,14 +3,15 @@ import logging
 import requests
 import urllib.parse as urlparse
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from docuware import cijson, errors, parser, utils
 
 from urllib3.exceptions import InsecureRequestWarning
 from urllib3 import disable_warnings
 
-from docuware.organization import Organization
 disable_warnings(InsecureRequestWarning)
 
 
@@ -29,6 +30,18 @@ TEXT_HEADERS = {
     "Accept": "text/plain",
 }
 
+IMAGE_HEADERS = {
+    "Accept": "image/*",
+}
+
+_REAUTH_CODES = frozenset({401, 403})
+
+# Keep-alive connections per host, enough for the thread pools used for prefetching
+_POOL_SIZE = 16
+
+# Upper bound for responses kept by get_json(cache=True), oldest entries are dropped first
+_ETAG_CACHE_SIZE = 256
+
 class Authenticator(ABC):
     @abstractmethod
     def authenticate(self, conn: Connection) -> requests.Session:
@@ -46,7 +59,7 @@ class Authenticator(ABC):
         url = conn.make_url(path)
         resp = conn.session.get(url, headers={**DEFAULT_HEADERS, **JSON_HEADERS})
         if resp.status_code == 200:
-            return resp.json(object_hook=conn._json_object_hook)
+            return resp.json(object_pairs_hook=conn._json_pairs_hook)
         raise errors.ResourceError("Failed to get resource", url=url, status_code=resp.status_code)
 
     def _post(
@@ -60,7 +73,7 @@ class Authenticator(ABC):
         headers = {**DEFAULT_HEADERS, **(headers or {}), **JSON_HEADERS}
         resp = conn.session.post(url, headers=headers, data=data)
         if resp.status_code == 200:
-            return resp.json(object_hook=conn._json_object_hook)
+            return resp.json(object_pairs_hook=conn._json_pairs_hook)
         raise errors.ResourceError("Failed to post to resource", url=url, status_code=resp.status_code)
 
 class CookieAuthenticator(Authenticator):
@@ -199,10 +212,28 @@ class Connection:
         self.base_url = base_url
         self.session = requests.Session()
         self.session.verify = verify_certificate
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=_POOL_SIZE,
+            pool_maxsize=_POOL_SIZE,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.authenticator = authenticator
-        self._json_object_hook = cijson.case_insensitive_hook if case_insensitive else None
+        self._json_pairs_hook = cijson.case_insensitive_pairs_hook if case_insensitive else None
+        self._etag_cache: OrderedDict[str, Tuple[str, Any]] = OrderedDict()
+
+    def clear_cache(self) -> None:
+        """Forget all responses kept by get_json(cache=True)."""
+        self._etag_cache.clear()
+
+    def close(self) -> None:
+        """Close the pooled connections of the session."""
+        self.clear_cache()
+        self.session.close()
 
     def make_path(self, path: str, query: dict) -> str:
+        if not query:
+            return path
         u = urlparse.urlsplit(path)
         q = "&".join(
             ([u.query] if u.query else []) +
@@ -212,12 +243,15 @@ class Connection:
     def make_url(self, path: str, query: Optional[dict] = None) -> str:
         if query:
             path = self.make_path(path, query)
+        elif path.startswith(("http://", "https://")):
+            # Already absolute, urljoin() would return it unchanged anyway
+            return path
         return urlparse.urljoin(self.base_url, path)
 
     def _post(self, url: str, headers: Optional[Dict[str, str]] = None, json: Optional[dict] = None, data: Optional[Any] = None):
         headers = {**DEFAULT_HEADERS, **headers} if headers else DEFAULT_HEADERS
         resp = self.session.post(url, headers=headers, json=json, data=data)
-        if resp.status_code in (401, 403) and self.authenticator:
+        if resp.status_code in _REAUTH_CODES and self.authenticator:
             self.session = self.authenticator.authenticate(self)
             resp = self.session.post(url, headers=headers, json=json, data=data)
         return resp
@@ -236,7 +270,7 @@ class Connection:
 
     def post_json(self, path: str, headers: Optional[Dict[str, str]] = None, json: Optional[dict] = None, data: Optional[Any] = None):
         headers = {**headers, **JSON_HEADERS} if headers else JSON_HEADERS
-        return self.post(path, headers=headers, json=json, data=data).json(object_hook=self._json_object_hook)
+        return self.post(path, headers=headers, json=json, data=data).json(object_pairs_hook=self._json_pairs_hook)
 
     def post_text(self, path: str, headers: Optional[Dict[str, str]] = None, json: Optional[dict] = None, data: Optional[Any] = None) -> str:
         headers = {**headers, **TEXT_HEADERS} if headers else TEXT_HEADERS
@@ -245,7 +279,7 @@ class Connection:
     def _put(self, url: str, headers: Optional[Dict[str, str]] = None, params: Optional[Any] = None, json: Optional[dict] = None, data: Optional[Any] = None):
         headers = {**DEFAULT_HEADERS, **headers} if headers else DEFAULT_HEADERS
         resp = self.session.put(url, headers=headers, params=params, json=json, data=data)
-        if resp.status_code in (401, 403) and self.authenticator:
+        if resp.status_code in _REAUTH_CODES and self.authenticator:
             self.session = self.authenticator.authenticate(self)
             resp = self.session.put(url, headers=headers, params=params, json=json, data=data)
         return resp
@@ -266,7 +300,7 @@ class Connection:
                  data: Optional[Any] = None):
         headers = {**headers, **JSON_HEADERS} if headers else JSON_HEADERS
         return self.put(path, headers=headers, params=params, json=json, data=data).json(
-            object_hook=self._json_object_hook)
+            object_pairs_hook=self._json_pairs_hook)
 
     def put_text(self, path: str, headers: Optional[Dict[str, str]] = None, params: Optional[Any] = None, json: Optional[dict] = None,
                  data: Optional[Any] = None):
@@ -276,7 +310,7 @@ class Connection:
     def _get(self, url: str, headers: Optional[Dict[str, str]] = None, data: Optional[Any] = None):
         headers = {**DEFAULT_HEADERS, **headers} if headers else DEFAULT_HEADERS
         resp = self.session.get(url, headers=headers, data=data)
-        if resp.status_code in (401, 403) and self.authenticator:
+        if resp.status_code in _REAUTH_CODES and self.authenticator:
             self.session = self.authenticator.authenticate(self)
             resp = self.session.get(url, headers=headers, data=data)
         return resp
@@ -293,9 +327,48 @@ class Connection:
                 status_code=resp.status_code
             )
 
-    def get_json(self, path: str, headers: Optional[Dict[str, str]] = None):
+    def get_json(self, path: str, headers: Optional[Dict[str, str]] = None, cache: bool = False):
+        """
+        With cache=True, responses carrying an ETag are kept and revalidated with
+        If-None-Match on the next request, a 304 response returns the kept result.
+        That result is shared by all callers of the same path, do not modify it.
+        """
         headers = {**headers, **JSON_HEADERS} if headers else JSON_HEADERS
-        return self.get(path, headers=headers).json(object_hook=self._json_object_hook)
+        if not cache:
+            return self.get(path, headers=headers).json(object_pairs_hook=self._json_pairs_hook)
+        url = self.make_url(path)
+        cached = self._etag_cache.get(url)
+        if cached:
+            headers = {**headers, "If-None-Match": cached[0]}
+        resp = self._get(url, headers=headers)
+        if resp.status_code == 304 and cached:
+            return cached[1]
+        if resp.status_code != 200:
+            raise errors.ResourceError(
+                f"GET request failed with code {resp.status_code}",
+                url=url,
+                status_code=resp.status_code
+            )
+        result = resp.json(object_pairs_hook=self._json_pairs_hook)
+        etag = resp.headers.get("ETag")
+        if etag:
+            self._etag_cache[url] = (etag, result)
+            if len(self._etag_cache) > _ETAG_CACHE_SIZE:
+                try:
+                    self._etag_cache.popitem(last=False)
+                except KeyError:
+                    # Emptied concurrently
+                    pass
+        return result
+
+    def get_json_many(self, paths: Iterable[str], headers: Optional[Dict[str, str]] = None, max_workers: int = 4,
+                      cache: bool = False) -> List[Any]:
+        """Fetch several JSON resources concurrently, results are in the same order as paths."""
+        paths = list(paths)
+        if len(paths) <= 1:
+            return [self.get_json(path, headers=headers, cache=cache) for path in paths]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as executor:
+            return list(executor.map(lambda path: self.get_json(path, headers=headers, cache=cache), paths))
 
     def get_text(self, path: str, headers: Optional[Dict[str, str]] = None):
         headers = {**headers, **TEXT_HEADERS} if headers else TEXT_HEADERS
@@ -305,7 +378,7 @@ class Connection:
                 data: Optional[Any] = None):
         headers = {**DEFAULT_HEADERS, **headers} if headers else DEFAULT_HEADERS
         resp = self.session.delete(url, headers=headers, params=params, json=json, data=data)
-        if resp.status_code in (401, 403) and self.authenticator:
+        if resp.status_code in _REAUTH_CODES and self.authenticator:
             self.session = self.authenticator.authenticate(self)
             resp = self.session.delete(url, headers=headers, params=params, json=json, data=data)
         return resp
@@ -338,4 +411,14 @@ class Connection:
             f"Download failed, code {resp.status_code}",
             url=url, status_code=resp.status_code)
 
+    def get_thumbnail(self, path: str) -> Tuple[bytes, str]:
+        """Like get_bytes(), but without Content-Disposition and Content-Length handling."""
+        url = self.make_url(path)
+        resp = self._get(url, headers=IMAGE_HEADERS)
+        if resp.status_code == 200:
+            return resp.content, resp.headers.get("Content-Type", "application/octet-stream")
+        raise errors.ResourceNotFoundError(
+            f"Download failed, code {resp.status_code}",
+            url=url, status_code=resp.status_code)
+
 # vim: set et sw=4 ts=4:
@@ -1,8 +1,9 @@
 from __future__ import annotations
 import logging
 import re
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, date
-from typing import Any, Iterator, Union, List, Optional, Tuple, Dict
+from typing import Any, Generator, Iterator, Union, List, Optional, Tuple, Dict
 
 from docuware import conn, errors, parser, structs, types, utils, document, fields
 
@@ -11,6 +12,11 @@ log = logging.getLogger(__name__)
 AND = "And"
 OR = "Or"
 
+_DIALOG_EXPRESSION_RE = re.compile(r"/DialogExpression\b", re.IGNORECASE)
+
+# Used for fetching the next page of search results in the background
+_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="docuware")
+
 
 class Dialog(types.DialogP):
     def __init__(self, config: dict, file_cabinet: types.FileCabinetP):
@@ -23,16 +29,8 @@ class Dialog(types.DialogP):
 
     @staticmethod
     def from_config(config: dict, file_cabinet: types.FileCabinetP):
-        dlg_type = config.get("Type")
-        if dlg_type == "Search":
-            return SearchDialog(config, file_cabinet)
-        elif dlg_type == "Store":
-            return StoreDialog(config, file_cabinet)
-        elif dlg_type == "ResultList":
-            return ResultListDialog(config, file_cabinet)
-        elif dlg_type == "TaskList":
-            return TaskListDialog(config, file_cabinet)
-        return Dialog(config, file_cabinet)
+        cls = _DIALOG_CLASSES.get(config.get("Type"), Dialog)
+        return cls(config, file_cabinet)
 
     def __str__(self):
         return f"{self.__class__.__name__} '{self.name}' [{self.id}]"
@@ -53,7 +51,7 @@ class TaskListDialog(Dialog):
 
     def _load(self):
         if self._fields is None:
-            config = self.client.conn.get_json(self.endpoints["self"])
+            config = self.client.dialog_config(self.endpoints["self"])
             # cijson.print_json(data)
             self._fields = {
                 f.id: f for f in
@@ -73,7 +71,7 @@ class SearchDialog(Dialog):
 
     def _load(self):
         if self._fields is None:
-            config = self.client.conn.get_json(self.endpoints["self"])
+            config = self.client.dialog_config(self.endpoints["self"])
             self._fields = {
                 f.id: f for f in
                 [SearchField(fld, self) for fld in config.get("Fields", [])]
@@ -86,25 +84,50 @@ class SearchDialog(Dialog):
         self._load()
         return self._fields or {}
 
+    def prefetch_field_values(self):
+        """Fetch the select lists of all fields at once, see SearchField.values()."""
+        pending = [f for f in self.fields.values() if f._values is None and "simpleSelectList" in f.endpoints]
+        results = self.client.conn.get_json_many(f.endpoints["simpleSelectList"] for f in pending)
+        for field, result in zip(pending, results):
+            field._values = result.get("Value", [])
+
     def search(self, conditions: dict[str, str], operation: Optional[str] = None):
         self._load()
         return self._query.search(conditions=conditions, operation=operation)
 
 
+_DIALOG_CLASSES = {
+    "Search": SearchDialog,
+    "Store": StoreDialog,
+    "ResultList": ResultListDialog,
+    "TaskList": TaskListDialog,
+}
+
+
 class SearchField:
     def __init__(self, config: Dict, dialog: Dialog):
+        get = config.get
         self.dialog = dialog
-        self.id: str = config.get("DBFieldName", "")
-        self.name: str = config.get("DlgLabel", self.id)
-        self.length: int = config.get("Length", -1)
-        self.type: Optional[str] = config.get("DWFieldType")
+        self.id: str = get("DBFieldName", "")
+        self.name: str = get("DlgLabel", self.id)
+        self.length: int = get("Length", -1)
+        self.type: Optional[str] = get("DWFieldType")
         self.endpoints = structs.Endpoints(config)
-
-    def values(self):
-        if "simpleSelectList" in self.endpoints:
-            result = self.dialog.client.conn.get_json(self.endpoints["simpleSelectList"])
-            return result.get("Value", [])
-        return []
+        self._values: Optional[List[Any]] = None
+
+    def values(self, refresh: bool = False) -> List[Any]:
+        """
+        Values of the field's select list. The list is fetched once and kept, use refresh=True
+        to fetch it again, e.g. after documents with new index values have been stored.
+        """
+        if self._values is None or refresh:
+            if "simpleSelectList" in self.endpoints:
+                result = self.dialog.client.conn.get_json(self.endpoints["simpleSelectList"])
+                self._values = result.get("Value", [])
+            else:
+                self._values = []
+        # Copy, so callers cannot modify the kept list
+        return list(self._values)
 
     def __str__(self):
         if self.length > 0:
@@ -113,47 +136,58 @@ class SearchField:
             return f"Field '{self.name}' [{self.id}, {self.type}]"
 
 
+_VALUE_CONVERTERS = {
+    str: str,
+    int: str,
+    float: str,
+    datetime: utils.datetime_to_string,
+    date: utils.date_to_string,
+}
+
+
 Conditions = Union[str, List[str], Tuple[str], Dict[str, Union[str, List[str]]]]
 
 
 class ConditionParser:
     def __init__(self, dialog: SearchDialog):
-        self.fields_by_name: Dict[str, SearchField] = {}
-        self.fields_by_id: Dict[str, SearchField] = {}
-        for field in dialog.fields.values():
-            self.fields_by_name[field.name.casefold()] = field
-            self.fields_by_id[field.id.casefold()] = field
+        # Field ids take precedence over field names
+        self._lookup: Dict[str, SearchField] = {}
+        dialog_fields = dialog.fields.values()
+        for field in dialog_fields:
+            self._lookup[field.name.casefold()] = field
+        for field in dialog_fields:
+            self._lookup[field.id.casefold()] = field
 
     @staticmethod
     def convert_field_value(value: Any) -> str:
         if value is None:
             return "*"
-        if isinstance(value, date):
-            value = datetime(value.year, value.month, value.day)
+        convert = _VALUE_CONVERTERS.get(type(value))
+        if convert is not None:
+            return convert(value)
+        # Subclasses; NB: datetime is a subclass of date, so check for it first
         if isinstance(value, datetime):
-            value = utils.datetime_to_string(value)
+            return utils.datetime_to_string(value)
+        if isinstance(value, date):
+            return utils.date_to_string(value)
         return str(value)
 
     def field_by_name(self, name: str) -> SearchField:
-        iname = name.casefold()
-        if iname in self.fields_by_id:
-            field = self.fields_by_id[iname]
-        elif iname in self.fields_by_name:
-            field = self.fields_by_name[iname]
-        else:
+        field = self._lookup.get(name.casefold())
+        if field is None:
             raise errors.SearchConditionError(f"Unknown field: {name}")
         return field
 
     def _term(self, name: str, value: Union[str, List[str]]) -> Tuple[str, List[str]]:
         field = self.field_by_name(name)
         if isinstance(value, str):
-            value = [value]
-        else:
-            try:
-                value = [self.convert_field_value(i) for i in value]
-            except TypeError:
-                value = [str(value)]
-        return field.id, value
+            return field.id, [value]
+        try:
+            values = iter(value)
+        except TypeError:
+            # Scalar: number, date, None, ...
+            return field.id, [self.convert_field_value(value)]
+        return field.id, [self.convert_field_value(i) for i in values]
 
     def parse_list(self, conditions: Union[List[str], Tuple[str]]) -> List[Tuple[str, List[str]]]:
         return [self._term(*parser.parse_search_condition(c)) for c in conditions]
@@ -186,10 +220,10 @@ class SearchQuery:
             #     /DocuWare/Platform/FileCabinets/<FC_ID>/Query/DialogExpressionLink?dialogId=<DLG_ID>
             # Looks like a bug in DocuWare's API.
             if "dialogExpression" in self.endpoints:
-                self.endpoints["dialogExpressionLink"] = re.sub(r"/DialogExpression\b",
-                                                                "/DialogExpressionLink",
-                                                                self.endpoints["dialogExpression"],
-                                                                flags=re.IGNORECASE)
+                self.endpoints["dialogExpressionLink"] = _DIALOG_EXPRESSION_RE.sub(
+                    "/DialogExpressionLink",
+                    self.endpoints["dialogExpression"],
+                )
             else:
                 raise errors.InternalError("Endpoint 'dialogExpression' missing")
 
@@ -198,14 +232,18 @@ class SearchQuery:
         return self.dialog.client.conn
 
     def search(self, conditions: Conditions, operation: str = None, sort_field: str = None, sort_order: str = None) -> SearchResult:
-        terms = self.cond_parser.parse(conditions)
-        query = {"fields": ",".join([t[0] for t in terms])}
+        field_ids = []
+        condition = []
+        for field_id, values in self.cond_parser.parse(conditions):
+            field_ids.append(field_id)
+            condition.append({"DBName": field_id, "Value": values})
+        query = {"fields": ",".join(field_ids)}
         if sort_field:
             query[
                 "sortOrder"] = f"{self.cond_parser.field_by_name(sort_field).id} {sort_order if sort_order else 'Asc'}"
         path = self.conn.make_path(self.endpoints["dialogExpressionLink"], query=query)
         data = {
-            "Condition": [{"DBName": k, "Value": v} for k, v in terms],
+            "Condition": condition,
             "Operation": operation or AND,
         }
         result_url = self.conn.post_text(path, json=data).split("\n", 1)[0]
@@ -221,23 +259,46 @@ class SearchResult:
         self.query = query
         self.count = config.get("Count", {}).get("Value", 0)
         self.endpoints = structs.Endpoints(config)
-        self.items = self._items(config)
-
-    def _items(self, config: dict) -> Iterator:
-        return (SearchResultItem(item, self) for item in config.get("Items", []))
-
-    def __iter__(self):
-        return self
-
-    def __next__(self):
-        while (item := next(self.items, None)) is None:
-            if "next" in self.endpoints:
-                result = self.query.dialog.client.conn.get_json(self.endpoints["next"])
-                self.endpoints = structs.Endpoints(result)
-                self.items = self._items(result)
-            else:
-                raise StopIteration
-        return item
+        self._next_page: Optional[Future] = None
+        # Single pass, like the paginated result itself
+        self._iterator = self._iterate(config)
+
+    def _prefetch(self):
+        # Overlap fetching the next page with the caller's processing of the current one
+        if "next" in self.endpoints:
+            self._next_page = _EXECUTOR.submit(self.query.conn.get_json, self.endpoints["next"])
+        else:
+            self._next_page = None
+
+    def _iterate(self, config: dict) -> Generator[SearchResultItem, None, None]:
+        # Runs on first consumption, callers only reading count request no further pages
+        self._prefetch()
+        while True:
+            for item in config.get("Items", []):
+                yield SearchResultItem(item, self)
+            if self._next_page is None:
+                return
+            config = self._next_page.result()
+            self.endpoints = structs.Endpoints(config)
+            self._prefetch()
+
+    def __iter__(self) -> Generator[SearchResultItem, None, None]:
+        return self._iterator
+
+    def __next__(self) -> SearchResultItem:
+        return next(self._iterator)
+
+    def prefetch_documents(self, workers: int = 8) -> Iterator[SearchResultItem]:
+        """
+        Iterate over the remaining items, with their documents fetched concurrently. All
+        pages are requested at once, so use this only for result sets of moderate size.
+        """
+        def fetch(item: SearchResultItem) -> SearchResultItem:
+            _ = item.document
+            return item
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            yield from executor.map(fetch, self)
 
     def __str__(self):
         return f"{self.__class__.__name__} [{self.count}]"
@@ -245,17 +306,41 @@ class SearchResult:
 
 class SearchResultItem:
     def __init__(self, config: dict, result: SearchResult):
+        get = config.get
         self.result = result
-        self.fields = [fields.FieldValue.from_config(f) for f in config.get("Fields", [])]
-        self.content_type = config.get("ContentType")
-        self.title = config.get("Title")
-        self.file_cabinet_id = config.get("FileCabinetId")
-        self.endpoints = structs.Endpoints(config)
+        self._raw_fields = get("Fields", [])
+        self._fields: Optional[List[fields.FieldValue]] = None
+        self._field_index: Optional[Dict[str, fields.FieldValue]] = None
+        self.content_type = utils.intern_str(get("ContentType"))
+        self.title = get("Title")
+        self.file_cabinet_id = get("FileCabinetId")
+        self._config = config
+        self._endpoints: Optional[structs.Endpoints] = None
         self._document = None
 
+    @property
+    def endpoints(self) -> structs.Endpoints:
+        if self._endpoints is None:
+            self._endpoints = structs.Endpoints(self._config)
+            self._config = None
+        return self._endpoints
+
+    @property
+    def fields(self) -> List[fields.FieldValue]:
+        if self._fields is None:
+            self._fields = [fields.FieldValue.from_config(f) for f in self._raw_fields]
+            self._raw_fields = None
+        return self._fields
+
+    def field(self, key: str, default: Union[Any, None, types.Nothing] = types.NOTHING):
+        """Access field value by id or name."""
+        if self._field_index is None:
+            self._field_index = structs.index_by_id_or_name(self.fields)
+        return structs.first_item_by_id_or_name_indexed(self._field_index, key, default)
+
     def thumbnail(self) -> Tuple[bytes, str, str]:
         dw = self.result.query.dialog.client
-        return dw.conn.get_bytes(self.endpoints["thumbnail"])
+        return document.Document._thumbnail(dw, self.endpoints["thumbnail"])
 
     @property
     def document(self):
@@ -1,6 +1,8 @@
 from __future__ import annotations
 import logging
-from typing import Any, Optional, Tuple, Union
+import mimetypes
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, Generator, Iterable, List, Optional, Tuple, Union
 
 from docuware import structs, types, utils, fields
 
@@ -8,24 +10,64 @@ log = logging.getLogger(__name__)
 
 
 class Document:
+    __slots__ = (
+        "file_cabinet", "id", "title", "content_type", "size", "modified", "created",
+        "_config", "_endpoints", "_raw_sections", "_attachments", "_raw_fields", "_fields", "_field_index",
+    )
+
     def __init__(self, config: dict, file_cabinet: types.FileCabinetP):
+        get = config.get
         self.file_cabinet = file_cabinet
-        self.id = config.get("Id")
-        self.title = config.get("Title")
-        self.content_type = config.get("ContentType")
-        self.size = config.get("FileSize", 0)
-        self.modified = utils.datetime_from_string(config.get("LastModified"))
-        self.created = utils.datetime_from_string(config.get("CreatedAt"))
-        self.endpoints = structs.Endpoints(config)
-        self.attachments = [DocumentAttachment(s, self) for s in config.get("Sections", [])]
-        self.fields = [fields.FieldValue.from_config(f) for f in config.get("Fields", [])]
+        self.id = get("Id")
+        self.title = get("Title")
+        self.content_type = utils.intern_str(get("ContentType"))
+        self.size = get("FileSize", 0)
+        self.modified = utils.datetime_from_string(get("LastModified"))
+        self.created = utils.datetime_from_string(get("CreatedAt"))
+        # Endpoints, attachments and fields are built on first access
+        self._config = config
+        self._endpoints: Optional[structs.Endpoints] = None
+        self._raw_sections = get("Sections", [])
+        self._attachments: Optional[List[DocumentAttachment]] = None
+        self._raw_fields = get("Fields", [])
+        self._fields: Optional[List[fields.FieldValue]] = None
+        self._field_index: Optional[Dict[str, fields.FieldValue]] = None
 
     @property
     def client(self) -> types.DocuwareClientP:
         return self.file_cabinet.organization.client
 
+    @property
+    def endpoints(self) -> structs.Endpoints:
+        if self._endpoints is None:
+            self._endpoints = structs.Endpoints(self._config)
+            self._config = None
+        return self._endpoints
+
+    @endpoints.setter
+    def endpoints(self, endpoints: structs.Endpoints):
+        self._endpoints = endpoints
+        self._config = None
+
+    @property
+    def attachments(self) -> List[DocumentAttachment]:
+        if self._attachments is None:
+            self._attachments = [DocumentAttachment(s, self) for s in self._raw_sections]
+            self._raw_sections = None
+        return self._attachments
+
+    @property
+    def fields(self) -> List[fields.FieldValue]:
+        if self._fields is None:
+            self._fields = [fields.FieldValue.from_config(f) for f in self._raw_fields]
+            self._raw_fields = None
+        return self._fields
+
     def field(self, key: str, default: Union[Any, None, types.Nothing] = types.NOTHING):
-        return structs.first_item_by_id_or_name(self.fields, key, default=default)
+        """Access field value by id or name."""
+        if self._field_index is None:
+            self._field_index = structs.index_by_id_or_name(self.fields)
+        return structs.first_item_by_id_or_name_indexed(self._field_index, key, default)
 
     @staticmethod
     def _download(client: types.DocuwareClientP, endpoint: str, keep_annotations: bool = True) -> Tuple[bytes, str, str]:
@@ -34,8 +76,13 @@ class Document:
             "targetFileType": "PDF" if keep_annotations else "Auto",
         })
 
+    @staticmethod
+    def _thumbnail(client: types.DocuwareClientP, endpoint: str) -> Tuple[bytes, str, str]:
+        data, mime = client.conn.get_thumbnail(endpoint)
+        return data, mime, f"thumbnail{mimetypes.guess_extension(mime.split(';')[0].strip()) or '.bin'}"
+
     def thumbnail(self) -> Tuple[bytes, str, str]:
-        return self.client.conn.get_bytes(self.endpoints["thumbnail"])
+        return Document._thumbnail(self.client, self.endpoints["thumbnail"])
 
     def download(self, keep_annotations: bool = True) -> Tuple[bytes, str, str]:
         return Document._download(
@@ -68,15 +115,21 @@ class Document:
 # Attachment seems more reasonable than Section. In the DocuWare context a section is
 # not a part of a file or document, but an individual attachment to the DocuWare document.
 class DocumentAttachment:
+    __slots__ = (
+        "document", "content_type", "filename", "id", "size", "pages", "modified",
+        "has_annotations", "endpoints",
+    )
+
     def __init__(self, config: dict, document: Document):
+        get = config.get
         self.document = document
-        self.content_type = config.get("ContentType")
-        self.filename = config.get("OriginalFileName")
-        self.id = config.get("Id")
-        self.size = config.get("FileSize", 0)
-        self.pages = config.get("PageCount", 0)
-        self.modified = utils.datetime_from_string(config.get("ContentModified"))
-        self.has_annotations = config.get("HasTextAnnotation")
+        self.content_type = utils.intern_str(get("ContentType"))
+        self.filename = get("OriginalFileName")
+        self.id = get("Id")
+        self.size = get("FileSize", 0)
+        self.pages = get("PageCount", 0)
+        self.modified = utils.datetime_from_string(get("ContentModified"))
+        self.has_annotations = get("HasTextAnnotation")
         self.endpoints = structs.Endpoints(config)
 
     @property
@@ -88,6 +141,19 @@ class DocumentAttachment:
             config = self.client.conn.get_json(self.endpoints["self"])
             self.endpoints = structs.Endpoints(config)
 
+    @staticmethod
+    def prefetch_endpoints(attachments: Iterable[DocumentAttachment]):
+        """
+        Fetch the missing download endpoints of several attachments at once, so
+        that subsequent calls of download() need only one request each.
+        """
+        pending = [att for att in attachments if "fileDownload" not in att.endpoints]
+        if not pending:
+            return
+        results = pending[0].client.conn.get_json_many(att.endpoints["self"] for att in pending)
+        for att, config in zip(pending, results):
+            att.endpoints = structs.Endpoints(config)
+
     def download(self, keep_annotations: bool = False) -> Tuple[bytes, str, str]:
         self._fetch_endpoints()
         data, mime, filename = Document._download(
@@ -102,3 +168,22 @@ class DocumentAttachment:
 
     def __str__(self):
         return f"Attachment '{self.filename}' [{self.id}, {self.content_type}]"
+
+
+def bulk_download(
+    documents: Iterable[Document],
+    keep_annotations: bool = True,
+    workers: int = 8,
+) -> Generator[Tuple[Document, Tuple[bytes, str, str]], None, None]:
+    """
+    Download several documents concurrently. Yields tuples of document and download
+    result in order of completion, not in the order of the given documents.
+    """
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        futures = {executor.submit(doc.download, keep_annotations=keep_annotations): doc for doc in documents}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+    finally:
+        # Consumer stopped early or a download failed: drop queued downloads, do not wait for running ones
+        executor.shutdown(wait=False, cancel_futures=True)
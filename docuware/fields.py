@@ -1,35 +1,84 @@
 from __future__ import annotations
 import logging
-from typing import Any, Iterator, Union, List, Tuple, Dict
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterator, Union, List, Optional, Tuple, Dict
 
-from docuware import cidict, errors, utils
+from docuware import errors, utils
 
 log = logging.getLogger(__name__)
 
+# ISO 8601 as emitted by newer DocuWare versions, e.g. "2023-01-31T12:00:00.123+01:00"
+_DW_DT_RE = re.compile(
+    r"^(\d{4})-(\d{2})-(\d{2})(?:T(\d{2}):(\d{2}):(\d{2})(?:\.(\d+))?(Z|[+-]\d{2}:?\d{2})?)?$"
+)
+
+
+def _datetime_from_iso(value: str) -> Optional[datetime]:
+    if value.startswith("/"):
+        # Microsoft JSON date, '/Date(...)/'
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        # Before Python 3.11 fromisoformat() rejects 'Z' and fractions other than 3 or 6 digits
+        pass
+    m = _DW_DT_RE.match(value)
+    if m is None:
+        return None
+    year, month, day, hour, minute, second, fraction, tz = m.groups()
+    tzinfo = None
+    if tz == "Z":
+        tzinfo = timezone.utc
+    elif tz:
+        offset = timedelta(hours=int(tz[1:3]), minutes=int(tz[-2:]))
+        tzinfo = timezone(-offset if tz[0] == "-" else offset)
+    try:
+        return datetime(
+            int(year), int(month), int(day),
+            int(hour or 0), int(minute or 0), int(second or 0),
+            int(fraction[:6].ljust(6, "0")) if fraction else 0,
+            tzinfo=tzinfo,
+        )
+    except ValueError:
+        return None
 
-class FieldValue:
-    TYPE_TABLE = {}
 
-    def __init__(self, config: dict):
-        self.name = config.get("FieldLabel")
-        self.id = config.get("FieldName")
-        self.content_type = config.get("ItemElementName")
-        self.read_only = config.get("ReadOnly", True)
-        self.internal = config.get("SystemField", False)
-        self.value = config.get("Item")
+class FieldValue:
+    __slots__ = ("name", "id", "content_type", "read_only", "internal", "value")
+
+    TYPE_TABLE: Dict[str, type] = {}
+    _TYPE_TABLE_CASEFOLDED: Dict[str, type] = {}
+
+    def __init__(self, config: dict, content_type: Optional[str] = None):
+        get = config.get
+        self.name = get("FieldLabel")
+        self.id = get("FieldName")
+        if content_type is None:
+            content_type = utils.intern_str(get("ItemElementName"))
+        self.content_type = content_type
+        self.read_only = get("ReadOnly", True)
+        self.internal = get("SystemField", False)
+        self.value = get("Item")
 
     @staticmethod
     def from_config(config: dict):
-        content_type = config.get("ItemElementName")
-        return FieldValue.TYPE_TABLE.get(content_type, FieldValue)(config)
+        # Interned keys let the table lookup succeed on identity
+        content_type = utils.intern_str(config.get("ItemElementName"))
+        cls = FieldValue.TYPE_TABLE.get(content_type)
+        if cls is None and content_type:
+            cls = FieldValue._TYPE_TABLE_CASEFOLDED.get(content_type.casefold())
+        return (cls or FieldValue)(config, content_type)
 
     def __str__(self):
         return f"Value '{self.name}' [{self.id}, {self.content_type}] = '{self.value}'"
 
 
 class StringFieldValue(FieldValue):
-    def __init__(self, config: dict):
-        super().__init__(config)
+    __slots__ = ()
+
+    def __init__(self, config: dict, content_type: Optional[str] = None):
+        super().__init__(config, content_type)
         self.value = str(self.value) if self.value else None
 
     def __str__(self):
@@ -37,18 +86,23 @@ class StringFieldValue(FieldValue):
 
 
 class KeywordsFieldValue(FieldValue):
-    def __init__(self, config: dict):
-        super().__init__(config)
-        values = config.get("Item", {}).get("Keyword", [])
-        self.value = values if values else None
+    __slots__ = ()
+
+    def __init__(self, config: dict, content_type: Optional[str] = None):
+        super().__init__(config, content_type)
+        # Item is already stored by the base class and may be missing or null
+        item = self.value
+        self.value = (item.get("Keyword") or None) if item else None
 
     def __str__(self):
-        return f"Keywords '{self.name}' [{self.id}] = {', '.join(self.value if self.value else [])}"
+        return f"Keywords '{self.name}' [{self.id}] = {', '.join(self.value) if self.value else ''}"
 
 
 class IntFieldValue(FieldValue):
-    def __init__(self, config: dict):
-        super().__init__(config)
+    __slots__ = ()
+
+    def __init__(self, config: dict, content_type: Optional[str] = None):
+        super().__init__(config, content_type)
         try:
             self.value = None if self.value is None else int(self.value)
         except ValueError:
@@ -60,8 +114,10 @@ class IntFieldValue(FieldValue):
 
 
 class DecimalFieldValue(FieldValue):
-    def __init__(self, config: dict):
-        super().__init__(config)
+    __slots__ = ()
+
+    def __init__(self, config: dict, content_type: Optional[str] = None):
+        super().__init__(config, content_type)
         try:
             self.value = None if self.value is None else float(self.value)
         except ValueError:
@@ -72,10 +128,14 @@ class DecimalFieldValue(FieldValue):
 
 
 class DateTimeFieldValue(FieldValue):
-
-    def __init__(self, config: dict):
-        super().__init__(config)
-        if self.content_type == "Date":
+    __slots__ = ()
+
+    def __init__(self, config: dict, content_type: Optional[str] = None):
+        super().__init__(config, content_type)
+        dt = _datetime_from_iso(self.value) if isinstance(self.value, str) else None
+        if dt is not None:
+            self.value = dt.date() if self.content_type == "Date" else dt
+        elif self.content_type == "Date":
             self.value = utils.date_from_string(self.value)
         else:
             self.value = utils.datetime_from_string(self.value)
@@ -84,11 +144,12 @@ class DateTimeFieldValue(FieldValue):
         return f"{self.content_type} '{self.name}' [{self.id}] = {self.value}"
 
 
-FieldValue.TYPE_TABLE = cidict.CaseInsensitiveDict({
+FieldValue.TYPE_TABLE = {
     "Date": DateTimeFieldValue,
     "DateTime": DateTimeFieldValue,
     "Int": IntFieldValue,
     "Decimal": DecimalFieldValue,
     "String": StringFieldValue,
     "Keywords": KeywordsFieldValue,
-})
+}
+FieldValue._TYPE_TABLE_CASEFOLDED = {k.casefold(): v for k, v in FieldValue.TYPE_TABLE.items()}
@@ -1,6 +1,7 @@
 from __future__ import annotations
 import logging
-from typing import List, Optional, Union
+from xml.sax.saxutils import escape, quoteattr
+from typing import Dict, Iterable, List, Optional, Union
 
 from docuware import structs, types, dialogs
 
@@ -14,31 +15,66 @@ class FileCabinet(types.FileCabinetP):
         self.id = config.get("Id")
         self.endpoints = structs.Endpoints(config)
         self._dialogs = None
+        self._dialog_index: Optional[Dict[str, types.DialogP]] = None
+        self._search_dialogs: Optional[List[dialogs.SearchDialog]] = None
+        self._search_dialog_index: Optional[Dict[str, dialogs.SearchDialog]] = None
 
     @property
     def dialogs(self) -> List[types.DialogP]:
         if self._dialogs is None:
-            result = self.organization.client.conn.get_json(self.endpoints["dialogs"])
-            self._dialogs = [
-                dialogs.Dialog.from_config(dlg, self) for dlg in result.get("Dialog", [])
-                if dlg.get("$type") == "DialogInfo" and ("_" not in dlg.get("Id"))
-                # and (dlg.get("IsDefault") or dlg.get("IsForMobile"))
-            ]
+            self._load_dialogs(self.organization.client.conn.get_json(self.endpoints["dialogs"], cache=True))
         return self._dialogs
 
+    def _load_dialogs(self, result: dict):
+        self._dialogs = [
+            dialogs.Dialog.from_config(dlg, self) for dlg in result.get("Dialog", [])
+            if dlg.get("$type") == "DialogInfo" and ("_" not in dlg.get("Id"))
+            # and (dlg.get("IsDefault") or dlg.get("IsForMobile"))
+        ]
+        self._index_dialogs()
+
+    @staticmethod
+    def prefetch_dialogs(file_cabinets: Iterable[FileCabinet], max_workers: int = 4):
+        """
+        Fetch the dialog lists of several file cabinets concurrently, useful when
+        walking through all file cabinets of an organization.
+        """
+        pending = [fc for fc in file_cabinets if fc._dialogs is None]
+        if not pending:
+            return
+        results = pending[0].organization.client.conn.get_json_many(
+            (fc.endpoints["dialogs"] for fc in pending),
+            max_workers=max_workers,
+            cache=True,
+        )
+        for fc, result in zip(pending, results):
+            fc._load_dialogs(result)
+
+    def _ensure_indexed(self):
+        if self._dialogs is None:
+            _ = self.dialogs
+        elif self._dialog_index is None:
+            self._index_dialogs()
+
+    def _index_dialogs(self):
+        self._dialog_index = structs.index_by_id_or_name(self._dialogs)
+        self._search_dialogs = [dlg for dlg in self._dialogs if isinstance(dlg, dialogs.SearchDialog)]
+        self._search_dialog_index = structs.index_by_id_or_name(self._search_dialogs)
+
     def dialog(self, key: str, default: Union[types.DialogP, None, types.Nothing] = types.NOTHING) -> Optional[types.DialogP]:
-        return structs.first_item_by_id_or_name(self.dialogs, key, default=default)
+        self._ensure_indexed()
+        return structs.first_item_by_id_or_name_indexed(self._dialog_index, key, default)
 
     def search_dialog(self, key: Optional[str] = None, default: Union[types.DialogP, None, types.Nothing] = types.NOTHING):
         # TODO: Is there a default search dialog?
+        self._ensure_indexed()
         if key:
-            return structs.first_item_by_id_or_name(
-                (dlg for dlg in self.dialogs if isinstance(dlg, dialogs.SearchDialog)),
-                key,
-                default=default
-            )
-        else:
-            return structs.first_item_by_class(self.dialogs, dialogs.SearchDialog, default=default)
+            return structs.first_item_by_id_or_name_indexed(self._search_dialog_index, key, default)
+        if self._search_dialogs:
+            return self._search_dialogs[0]
+        if default is types.NOTHING:
+            raise KeyError(dialogs.SearchDialog.__name__)
+        return default
 
     # This method from PR#4 needs a complete rewrite
     def create_data_entry(self, data: dict):
@@ -54,20 +90,15 @@ class FileCabinet(types.FileCabinetP):
         will return the result. If there is a problem creating the data entry, it will return False.
         """
 
-        xml_head = """<Document xmlns='http://dev.docuware.com/schema/public/services/platform' Id='1'>
-<Fields>"""
-
-        xml_middle = ""
+        parts = ["<Document xmlns='http://dev.docuware.com/schema/public/services/platform' Id='1'>\n<Fields>"]
         for key, value in data.items():
-            xml_field = f"""<Field FieldName='{key}'>
-<String>{value}</String>
-</Field>"""
-            xml_middle += xml_field
-
-        xml_foot = """</Fields>
-</Document>"""
-
-        xml_payload = xml_head + xml_middle + xml_foot
+            parts.append(
+                f"<Field FieldName={quoteattr(str(key))}>\n"
+                f"<String>{escape(str(value))}</String>\n"
+                f"</Field>"
+            )
+        parts.append("</Fields>\n</Document>")
+        xml_payload = "".join(parts)
 
         headers = {
             "Content-Type": "application/xml",
@@ -76,7 +107,7 @@ class FileCabinet(types.FileCabinetP):
 
         try:
             result = self.organization.client.conn.post_text(f"{self.endpoints['documents']}", headers=headers,
-                                                             data=str.encode(xml_payload))
+                                                             data=xml_payload.encode("utf-8"))
         except Exception as e:
             log.debug(f"Problem creating data entry:\n\n{e}")
             return False
@@ -100,16 +131,9 @@ class FileCabinet(types.FileCabinetP):
         the result of the request. If there is an error during the update, it will return False.
         """
 
-        fc_fields = []
-        # Retrieve and extract file cabinet fields and types
+        # Retrieve file cabinet field types
         dlg = self.search_dialog()
-        for field in dlg.fields.values():
-            fc_field = {}
-            fc_field["id"] = field.id
-            fc_field["length"] = field.length
-            fc_field["name"] = field.name
-            fc_field["type"] = field.type
-            fc_fields.append(fc_field)
+        type_by_id = {field.id.upper(): field.type for field in dlg.fields.values()}
 
         # The above code is performing a search query using a search dialog. It then checks the count
         # of the search results. If there is only one result, it retrieves the document ID of that
@@ -117,11 +141,9 @@ class FileCabinet(types.FileCabinetP):
         # more than one result, it logs a debug message and returns False, indicating that the update
         # request can only be executed for one document and the user needs to specify their search
         # query.
-        dlg = self.search_dialog()
         fc_search = dlg.search(query)
         if fc_search.count == 1:
-            for result in fc_search:
-                document_id = result.document.id
+            document_id = next(fc_search).document.id
         elif fc_search.count < 1:
             log.debug('Update search query returned no results, update request will not be executed.')
             return False
@@ -135,28 +157,18 @@ class FileCabinet(types.FileCabinetP):
             "Content-Type": "application/json"
         }
 
+        # Only decimal fields need a dedicated element name, everything else is sent as string
         body = {
-            "Field": []
+            "Field": [
+                {
+                    "FieldName": key,
+                    "Item": value,
+                    "ItemElementName": "Decimal" if type_by_id.get(key.upper()) == "Decimal" else "String",
+                }
+                for key, value in data.items()
+            ]
         }
 
-        # The above code is iterating over the items in the `data` dictionary. For each key-value
-        # pair, it creates a list called `item_element_name` using a list comprehension.
-        for key, value in data.items():
-            # The above code is creating a list called `item_element_name` using a list comprehension.
-            # It checks each element `x` in the list `fc_fields` and checks if the value of the `type`
-            # key in `x` is equal to 'Decimal'. If it is, the corresponding element in
-            # `item_element_name` is set to 'Float'. If not, it checks if the value of the `type` key
-            # is equal to 'Numeric'. If it is, the corresponding element in `item_element_name` is set
-            # to 'Integer'. If neither condition is met, the corresponding element
-            item_element_name = ['Decimal' if x['type'] == 'Decimal' else 'String' for x in fc_fields if
-                                 x['id'] == key.upper()]
-            field = {
-                "FieldName": key,
-                "Item": value,
-                "ItemElementName": item_element_name[0]
-            }
-            body["Field"].append(field)
-
         try:
             # result = self.client.conn.put(f"{self.endpoints['filecabinets']}/{fc.id}/Documents/{document_id}/Fields", headers=headers, json=body)
             result = self.organization.client.conn.put(
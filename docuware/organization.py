@@ -1,6 +1,6 @@
 from __future__ import annotations
 import logging
-from typing import Generator, List, Optional, TypeVar, Union
+from typing import Dict, List, Optional, TypeVar, Union
 
 from docuware import cidict, conn, dialogs, structs, types, users, filecabinet
 
@@ -16,19 +16,27 @@ class Organization(types.OrganizationP):
         self.id = config.get("Id")
         self.endpoints = structs.Endpoints(config)
         self._info = None
+        self._file_cabinets: Optional[List[types.FileCabinetP]] = None
+        self._file_cabinet_index: Optional[Dict[str, types.FileCabinetP]] = None
         self._dialogs = None
+        self._dialog_index: Optional[Dict[str, types.DialogP]] = None
 
     @property
     def conn(self) -> conn.Connection:
         return self.client.conn
 
     @property
-    def file_cabinets(self) -> Generator[types.FileCabinetP, None, None]:
-        result = self.client.conn.get_json(self.endpoints["filecabinets"])
-        return (filecabinet.FileCabinet(fc, self) for fc in result.get("FileCabinet", []))
+    def file_cabinets(self) -> List[types.FileCabinetP]:
+        if self._file_cabinets is None:
+            result = self.client.conn.get_json(self.endpoints["filecabinets"])
+            self._file_cabinets = [filecabinet.FileCabinet(fc, self) for fc in result.get("FileCabinet", [])]
+            self._file_cabinet_index = structs.index_by_id_or_name(self._file_cabinets)
+        return self._file_cabinets
 
     def file_cabinet(self, key: str, default: Union[T, None, types.Nothing] = types.NOTHING) -> Optional[types.FileCabinetP]:
-        return structs.first_item_by_id_or_name(self.file_cabinets, key, default=default)
+        if self._file_cabinet_index is None:
+            _ = self.file_cabinets
+        return structs.first_item_by_id_or_name_indexed(self._file_cabinet_index, key, default)
 
     @property
     def my_tasks(self):
@@ -42,15 +50,23 @@ class Organization(types.OrganizationP):
         # It is unclear whether the dialogs here differ from those of FileCabinet or not.
         if self._dialogs is None:
             fc_by_id = {fc.id: fc for fc in self.file_cabinets}
-            result = self.client.conn.get_json(self.endpoints["dialogs"])
-            self._dialogs = [
-                dialogs.Dialog.from_config(dlg, fc_by_id[dlg.get("FileCabinetId")]) for dlg in result.get("Dialog", [])
-                if dlg.get("$type") == "DialogInfo" and dlg.get("FileCabinetId") in fc_by_id
-            ]
+            result = self.client.conn.get_json(self.endpoints["dialogs"], cache=True)
+            # Only cache a complete list, a failed request is tried again on next access
+            dlgs = []
+            for dlg in result.get("Dialog", []):
+                if dlg.get("$type") != "DialogInfo":
+                    continue
+                fc = fc_by_id.get(dlg.get("FileCabinetId"))
+                if fc is not None:
+                    dlgs.append(dialogs.Dialog.from_config(dlg, fc))
+            self._dialog_index = structs.index_by_id_or_name(dlgs)
+            self._dialogs = dlgs
         return self._dialogs
 
     def dialog(self, key: str, default: Union[types.DialogP, None, types.Nothing] = types.NOTHING) -> Optional[types.DialogP]:
-        return structs.first_item_by_id_or_name(self.dialogs, key, default=default)
+        if self._dialog_index is None:
+            _ = self.dialogs
+        return structs.first_item_by_id_or_name_indexed(self._dialog_index, key, default)
 
     @property
     def info(self) -> cidict.CaseInsensitiveDict:
@@ -59,8 +75,8 @@ class Organization(types.OrganizationP):
             self.endpoints = structs.Endpoints(result)
             self._info = cidict.CaseInsensitiveDict(result.get("AdditionalInfo", {}))
             # Remove empty lines
-            self._info["CompanyNames"] = [line for line in self._info["CompanyNames"] if line] or [self.name]
-            self._info["AddressLines"] = [line for line in self._info["AddressLines"] if line]
+            self._info["CompanyNames"] = list(filter(None, self._info["CompanyNames"])) or [self.name]
+            self._info["AddressLines"] = list(filter(None, self._info["AddressLines"]))
         return self._info
 
     @property
@@ -1,5 +1,6 @@
 from __future__ import annotations
 import collections
+import re
 from typing import List, Optional, Tuple, Union
 
 from docuware import cidict
@@ -30,6 +31,18 @@ class CharReader:
         return f"CharReader({repr(self.text)})"
 
 
+_WHITESPACE_RE = re.compile(r"\s*")
+
+_CD_TYPE_RE = re.compile(r"\s*([^;]*)")
+_CD_SEPARATOR_RE = re.compile(r"[\s;]*")
+_CD_PARAM_RE = re.compile(r'([^\W_]+)=\s*(?:"([^"]*)("?)|([^\s;]*))')
+
+_SC_FIELDNAME_RE = re.compile(r"\s*([^=\s]*)\s*")
+_SC_QUOTED_RE = re.compile(r'"((?:[^"\\]|\\.)*)\\?"?', re.DOTALL)
+_SC_PLAIN_RE = re.compile(r"[^,]*")
+_SC_UNESCAPE_RE = re.compile(r"\\(.)", re.DOTALL)
+
+
 def parse_content_disposition(text: str, case_insensitive: bool = True) -> Union[dict, cidict.CaseInsensitiveDict]:
     """
     Parser for HTTP Content-Disposition header values. For example 'attachment; filename="filename.jpg"' will
@@ -40,90 +53,32 @@ def parse_content_disposition(text: str, case_insensitive: bool = True) -> Union
     :return: A dict-like object.
     """
     fields = cidict.CaseInsensitiveDict() if case_insensitive else dict()
-    if text is None:
+    if not text or text.isspace():
         return fields
 
-    state = 0
-    key = ""
-    value = ""
-    reader = CharReader(text)
+    m = _CD_TYPE_RE.match(text)
+    fields["type"] = m[1].rstrip()
+    pos = m.end()
+    end = len(text)
 
     while True:
-        ch = reader.getch()
-        # print(state, ch)
-        if state == 0:  # type identifier
-            if ch is None:
-                break
-            elif ch.isspace():
-                pass
-            else:
-                reader.ungetch(ch)
-                value = ""
-                state = 1
-        elif state == 1:
-            if ch == ";":
-                fields["type"] = value.rstrip()
-                state = 10
-            elif ch is None:
-                fields["type"] = value.rstrip()
-                break
-            else:
-                value += ch
-        elif state == 10:  # key/value pair
-            if ch is None:
-                break
-            if ch.isspace() or ch == ";":
-                pass
-            elif ch.isalnum():
-                reader.ungetch(ch)
-                key = ""
-                value = ""
-                state = 11
-            else:
-                raise ValueError
-        elif state == 11:  # key of key/value pair
-            if ch == "=":
-                key = key.rstrip()
-                state = 20
-            elif ch.isalnum():
-                key += ch
-            else:
-                raise ValueError
-        elif state == 20:  # value of key/value pair
-            if ch is None or ch == ";":
-                fields[key] = value
-                state = 10
-            elif ch == '"':
-                state = 25
-            elif ch.isspace():
-                pass
-            else:
-                reader.ungetch(ch)
-                state = 21
-        elif state == 21:  # plain value
-            if ch is None or ch.isspace() or ch == ";":
-                fields[key] = value
-                state = 10
-            else:
-                value += ch
-        elif state == 25:  # value in quotation marks
-            if ch is None:
+        pos = _CD_SEPARATOR_RE.match(text, pos).end()
+        if pos >= end:
+            break
+        m = _CD_PARAM_RE.match(text, pos)
+        if m is None:
+            raise ValueError
+        key, quoted, closed, plain = m.groups()
+        pos = m.end()
+        if quoted is None:
+            fields[key] = plain
+        else:
+            fields[key] = quoted
+            if not closed:
                 # unexpected, but ...
-                fields[key] = value
                 break
-            elif ch == '"':
-                fields[key] = value
-                state = 26
-            else:
-                value += ch
-        elif state == 26:  # expecting semicolon
-            if ch is None:
-                break
-            elif ch == ";":
-                state = 10
-            elif ch.isspace():
-                pass
-            else:
+            pos = _WHITESPACE_RE.match(text, pos).end()
+            if pos < end and text[pos] != ";":
                 raise ValueError
 
     return fields
@@ -140,78 +95,44 @@ def parse_search_condition(text: str) -> Tuple[str, List[str]]:
     :return: Tuple of fieldname and list of keywords.
     """
 
-    state = 0
-    value = ""
-    fieldname = ""
+    text = text or ""
+
+    # Fast path for the common case without quoting or escaping
+    if "\"" not in text and "\\" not in text:
+        fieldname, sep, rest = text.partition("=")
+        fieldname = fieldname.strip()
+        if sep and len(fieldname.split()) <= 1:
+            return fieldname, [kw for kw in (v.strip() for v in rest.split(",")) if kw]
+
+    m = _SC_FIELDNAME_RE.match(text)
+    fieldname = m[1]
+    pos = m.end()
+    end = len(text)
     keywords = []
-    reader = CharReader(text or "")
+
+    if pos >= end:
+        return fieldname, keywords
+    if text[pos] != "=":
+        raise ValueError(f"Unexpected character found: '{text[pos]}'")
+    pos += 1
 
     while True:
-        ch = reader.getch()
-        # print(state, ch)
-        if state == 0:  # before fieldname
-            if ch is None:
-                break
-            elif ch.isspace():
-                pass
-            else:
-                reader.ungetch(ch)
-                value = ""
-                state = 1
-        elif state == 1:  # fieldname
-            if ch is None:
-                fieldname = value
-                break
-            elif ch == "=" or ch.isspace():
-                reader.ungetch(ch)
-                fieldname = value
-                state = 2
-            else:
-                value += ch
-        elif state == 2:  # after fieldname
-            if ch is None:
-                break
-            elif ch.isspace():
-                pass
-            elif ch == "=":
-                state = 10
-            else:
-                raise ValueError(f"Unexpected character found: '{ch}'")
-        elif state == 10:  # before keyword
-            value = ""
-            if ch is None:
-                break
-            elif ch.isspace():
-                pass
-            elif ch == "\"":
-                state = 20
-            elif ch == "\\":
-                state = 11
-            else:
-                reader.ungetch(ch)
-                state = 11
-        elif state == 11:  # keyword
-            if ch is None or ch == ",":
-                value = value.rstrip()
-                state = 30
-            else:
-                value += ch
-        elif state == 20:  # "keyword"
-            if ch is None or ch == "\"":
-                # unexpected end
-                state = 30
-            elif ch == "\\":
-                value += reader.getch() or ""
-            else:
-                value += ch
-        elif state == 30:  # after keyword
-            if value:
-                keywords.append(value)
-            if ch is None:
-                break
-            else:
-                reader.ungetch(ch)
-                state = 10
+        pos = _WHITESPACE_RE.match(text, pos).end()
+        if pos >= end:
+            break
+        if text[pos] == "\"":
+            m = _SC_QUOTED_RE.match(text, pos)
+            value = _SC_UNESCAPE_RE.sub(r"\1", m[1])
+            pos = m.end()
+        else:
+            if text[pos] == "\\":
+                pos += 1
+            m = _SC_PLAIN_RE.match(text, pos)
+            value = m[0].rstrip()
+            # Skip the comma, if any
+            pos = m.end() + 1
+        if value:
+            keywords.append(value)
 
     return fieldname, keywords
 
@@ -1,50 +1,66 @@
 from __future__ import annotations
 import re
-from typing import Iterable, List, Optional, Type, TypeVar, Union
+from typing import Dict, Iterable, List, Optional, Tuple, Type, TypeVar, Union
 
 from docuware import cidict, errors, types
 
 T = TypeVar("T")
 
+_FIELD_RE = re.compile(r"\{(\w+)\}")
+
 
 class Endpoints(cidict.CaseInsensitiveDict):
     def __init__(self, config: Union[dict, cidict.CaseInsensitiveDict]):
         super().__init__()
-        for link in config.get("Links", []):
-            self[link["rel"]] = link["href"]
+        self._items = {link["rel"].casefold(): (link["rel"], link["href"]) for link in config.get("Links") or []}
 
 
 class Resources(cidict.CaseInsensitiveDict):
     def __init__(self, config: Union[dict, cidict.CaseInsensitiveDict]):
         super().__init__()
-        for rc in config.get("Resources", []):
-            r = ResourcePattern(rc)
-            self[r.name] = r
+        patterns = (ResourcePattern(rc) for rc in config.get("Resources") or [])
+        self._items = {r.name.casefold(): (r.name, r) for r in patterns}
 
 
 class ResourcePattern:
+    __slots__ = ("name", "pattern", "fields", "_template", "_names")
+
     def __init__(self, config: Union[dict, cidict.CaseInsensitiveDict]):
         self.name = config.get("Name")
         self.pattern = config.get("UriPattern")
-        self._fields = None
-
-    @property
-    def fields(self) -> List[str]:
-        if self._fields is None:
-            self._fields = re.findall(r"\{(\w+)\}", self.pattern)
-        return self._fields
+        # Pattern split into (None, literal) and (casefolded name, "{name}") segments
+        self._template: List[Tuple[Optional[str], str]] = []
+        pos = 0
+        for m in _FIELD_RE.finditer(self.pattern or ""):
+            if m.start() > pos:
+                self._template.append((None, self.pattern[pos:m.start()]))
+            self._template.append((m.group(1).casefold(), m.group(0)))
+            pos = m.end()
+        if pos < len(self.pattern or ""):
+            self._template.append((None, self.pattern[pos:]))
+        self._names = frozenset(key for key, _ in self._template if key is not None)
+        self.fields: Tuple[str, ...] = tuple(text[1:-1] for key, text in self._template if key is not None)
 
     def apply(self, data: Union[dict, cidict.CaseInsensitiveDict], strict: bool = False) -> str:
-        s = self.pattern
-        for name, value in data.items():
-            s, n = re.subn("\\{" + name + "\\}", value, s, flags=re.IGNORECASE)
-            if strict and n <= 0:
-                raise errors.InternalError(f"Key '{name}' not found in pattern '{self.pattern}'")
+        lookup = {name.casefold(): value for name, value in data.items()}
+        parts = []
+        missing = []
+        for key, text in self._template:
+            if key is None:
+                parts.append(text)
+            elif key in lookup:
+                parts.append(lookup[key])
+            else:
+                # Unresolved placeholders are kept as they are
+                parts.append(text)
+                missing.append(text[1:-1])
         if strict:
-            f = re.findall(r"\{(\w+)\}", s)
-            if f:
-                raise errors.InternalError(f"Pattern '{self.pattern}' incomplete, missing fields: {', '.join(f)}")
-        return s
+            for name in data:
+                if name.casefold() not in self._names:
+                    raise errors.InternalError(f"Key '{name}' not found in pattern '{self.pattern}'")
+            if missing:
+                raise errors.InternalError(f"Pattern '{self.pattern}' incomplete, missing fields: {', '.join(missing)}")
+        return "".join(parts)
 
     def __lt__(self, other: object):
         if isinstance(other, ResourcePattern):
@@ -66,6 +82,32 @@ def first_item_by_id_or_name(items: Iterable[T], key: str, default: Union[T, Non
         return default
 
 
+def index_by_id_or_name(items: Iterable[T]) -> Dict[str, T]:
+    """Casefolded id/name index for repeated lookups, ids take precedence over names."""
+    if not isinstance(items, (list, tuple)):
+        # Two passes are needed, so one-shot iterables are materialized once
+        items = tuple(items)
+    index = {}
+    for item in items:
+        if item.id:
+            index[str(item.id).casefold()] = item
+    for item in items:
+        if item.name:
+            index.setdefault(item.name.casefold(), item)
+    return index
+
+
+def first_item_by_id_or_name_indexed(index: Dict[str, T], key: str, default: Union[T, None, types.Nothing] = types.NOTHING) -> Optional[T]:
+    """Lookup in an index built by ``index_by_id_or_name``."""
+    item = index.get(key.casefold())
+    if item is not None:
+        return item
+    if default is types.NOTHING:
+        raise KeyError(key)
+    else:
+        return default
+
+
 def first_item_by_class(items: Iterable[T], cls: Type, default: Union[T, None, types.Nothing] = types.NOTHING) -> Optional[T]:
     for item in items:
         if isinstance(item, cls):
@@ -1,5 +1,6 @@
 from __future__ import annotations
 import logging
+from typing import Generator
 
 from docuware import conn, structs, types, utils, organization
 
@@ -12,24 +13,29 @@ class MyTasks(types.MyTasksP):
     def __init__(self, config: dict, organization: types.OrganizationP):
         self.organization = organization
         self.endpoints = structs.Endpoints(config)
-        self._tasks = None
         self.count = 0
         self.timestamp = None
-        self.refresh()
+        self._first_page = None
 
-    def refresh(self):
-        result = self.organization.client.conn.get_json(self.endpoints["myTasks"])
-        self._tasks = iter(result.get("Task", []))
+    def _fetch(self, endpoint: str) -> dict:
+        result = self.organization.client.conn.get_json(endpoint)
         self.count = result.get("Count", 0)
         self.timestamp = utils.datetime_from_string(result.get("TimeStamp"))
+        return result
 
-    def __iter__(self):
-        return self
-
-    def __next__(self):
-        if self._tasks:
-            return next(self._tasks)
-        else:
-            raise StopIteration
+    def refresh(self):
+        self._first_page = self._fetch(self.endpoints["myTasks"])
+
+    def __iter__(self) -> Generator[dict, None, None]:
+        # The first page is kept, iterating again only fetches further pages
+        if self._first_page is None:
+            self.refresh()
+        result = self._first_page
+        while True:
+            yield from result.get("Task") or []
+            endpoint = structs.Endpoints(result).get("next")
+            if not endpoint:
+                break
+            result = self._fetch(endpoint)
 
 # vim: set et sw=4 ts=4:
@@ -34,6 +34,9 @@ class DocuwareClientP(Protocol):
     def logoff(self):
         ...
 
+    def dialog_config(self, endpoint: str) -> dict:
+        ...
+
 
 class OrganizationP(Protocol):
     @property
@@ -1,18 +1,22 @@
 from __future__ import annotations
 import logging
-from typing import Dict, Generator, Optional, Union
-
-import re
-import requests
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Generator, Iterable, List, Optional, Tuple, Union
 
 from . import errors, types, structs, utils
 
 
 log = logging.getLogger(__name__)
 
+_DB_NAME_DELETE = bytes(c for c in range(128) if not chr(c).isalnum())
 
 
 class User:
+    __slots__ = (
+        "salutation", "email", "db_name", "organization", "id",
+        "_first_name", "_last_name", "_full_name", "_active", "_endpoints", "_config",
+    )
+
     def __init__(
             self,
             name: Optional[str] = None,
@@ -31,28 +35,34 @@ class User:
         self.organization = None
         self.id = None
         self._active = None
-        self.endpoints = None
+        self._endpoints = None
+        self._config = None
 
     @property
     def name(self) -> str:
-        if self._full_name:
-            return self._full_name
-        else:
-            return " ".join([n for n in [self._first_name, self._last_name] if n])
+        if not self._full_name:
+            # Derived names are kept until first or last name change
+            self._full_name = " ".join(filter(None, (self._first_name, self._last_name)))
+        return self._full_name
 
     @name.setter
     def name(self, name: str):
         if name:
             self._full_name = name
-            parts = name.split(", ", 1)
-            if len(parts) > 1:
-                self._last_name = parts[0]
-                self._first_name = parts[1]
+            if " " not in name:
+                # Single token, also rules out the "Last, First" form
+                self._first_name = None
+                self._last_name = name
+                return
+            last, sep, first = name.partition(", ")
+            if sep:
+                self._last_name = last
+                self._first_name = first
             else:
-                parts = name.split(" ", 1)
-                if len(parts) > 1:
-                    self._first_name = parts[0]
-                    self._last_name = parts[1]
+                first, sep, last = name.partition(" ")
+                if sep:
+                    self._first_name = first
+                    self._last_name = last
                 else:
                     self._first_name = None
                     self._last_name = name
@@ -77,49 +87,70 @@ class User:
         self._last_name = last_name
         self._full_name = None
 
+    @property
+    def endpoints(self) -> Optional[structs.Endpoints]:
+        # Built from the server response on first use
+        if self._endpoints is None and self._config is not None:
+            self._endpoints = structs.Endpoints(self._config)
+            self._config = None
+        return self._endpoints
+
+    @endpoints.setter
+    def endpoints(self, endpoints: Optional[structs.Endpoints]):
+        self._endpoints = endpoints
+        self._config = None
+
     @property
     def groups(self) -> Generator[Group, None, None]:
-        result = self.organization.client.conn.get_json(self.endpoints["groups"])
+        result = self.organization.conn.get_json(self.endpoints["groups"])
         return (Group.from_response(g, self.organization) for g in result.get("Item", []))
 
     def make_db_name(self) -> str:
         n = "".join([n for n in [self._last_name, self._first_name] if n]) or self.name
-        n = re.sub(r"[^A-Za-z0-9]", "", n) or str(id(self))
+        # Drop non-ASCII characters, then all ASCII characters that are not alphanumeric
+        n = n.encode("ascii", "ignore").translate(None, _DB_NAME_DELETE).decode("ascii") or str(id(self))
         return n[0:8].upper()
 
     @staticmethod
     def from_response(response: dict, organization: types.OrganizationP) -> User:
-        u = User(
-            salutation=response.get("Salutation"),
-            email=response.get("EMail"),
-        )
-        u._full_name = response.get("Name")
-        u._first_name = response.get("FirstName")
-        u._last_name = response.get("LastName")
-        u.id = response.get("Id")
-        u.db_name = response.get("DBName")
-        u._active = response.get("Active")
-        u.endpoints = structs.Endpoints(response)
+        # All slots are set here, running __init__ and its name setters is not needed
+        get = response.get
+        u = User.__new__(User)
+        u.salutation = get("Salutation")
+        u.email = get("EMail")
+        u._full_name = get("Name")
+        u._first_name = get("FirstName")
+        u._last_name = get("LastName")
+        u.id = get("Id")
+        u.db_name = get("DBName")
+        u._active = get("Active")
+        u._endpoints = None
+        u._config = response
         u.organization = organization
         return u
 
     def as_dict(self, overrides: Optional[Dict[str, str]] = None) -> Dict[str, str]:
-        d = {
-            item[0]: item[1] for item in [
-                ("Name", self.name),
-                ("FirstName", self.first_name),
-                ("LastName", self.last_name),
-                ("Salutation", self.salutation),
-                ("EMail", self.email),
-                ("Id", self.id),
-                ("DBName", self.db_name),
-                ("Active", self.active),
-            ] if item[1]
-        }
+        d = {}
+        name = self.name
+        if name:
+            d["Name"] = name
+        if self._first_name:
+            d["FirstName"] = self._first_name
+        if self._last_name:
+            d["LastName"] = self._last_name
+        if self.salutation:
+            d["Salutation"] = self.salutation
+        if self.email:
+            d["EMail"] = self.email
+        if self.id:
+            d["Id"] = self.id
+        if self.db_name:
+            d["DBName"] = self.db_name
+        if self._active:
+            d["Active"] = True
         if overrides:
-            return {**d, **overrides}
-        else:
-            return d
+            d.update(overrides)
+        return d
 
     @property
     def active(self) -> bool:
@@ -133,7 +164,8 @@ class User:
             body = self.as_dict(overrides={"Active": state})
             try:
                 result = self.organization.conn.post_json(self.organization.endpoints["userInfo"], json=body)
-            except requests.RequestException as exc:
+            except (OSError, errors.ApiError) as exc:
+                # requests.RequestException is an OSError, failed requests raise ApiError
                 raise errors.UserOrGroupError(f"Unable to set activation status of user {self}: {exc}")
             else:
                 self._active = state
@@ -144,6 +176,14 @@ class User:
     def remove_from_group(self, group: Group) -> bool:
         return group.remove_user(self)
 
+    def add_to_groups(self, groups: Iterable[Group]) -> bool:
+        """Add user to several groups with a single request."""
+        return _set_group_membership(self.organization, self, _group_ids(groups), include=True)
+
+    def remove_from_groups(self, groups: Iterable[Group]) -> bool:
+        """Remove user from several groups with a single request."""
+        return _set_group_membership(self.organization, self, _group_ids(groups), include=False)
+
     def __str__(self) -> str:
         return f"{self.__class__.__name__} '{self.name}' [{self.id}]"
 
@@ -154,13 +194,17 @@ class User:
 class Users:
     def __init__(self, organization: types.OrganizationP):
         self.organization = organization
+        self._index: Optional[Dict[str, User]] = None
 
     def __iter__(self) -> Generator[User, None, None]:
         result = self.organization.conn.get_json(self.organization.endpoints["users"])
         return (User.from_response(user, self.organization) for user in result.get("User", []))
 
     def __getitem__(self, key: str) -> User:
-        return structs.first_item_by_id_or_name(self, key)
+        # Lookups share one fetched list, iterating always fetches anew
+        if self._index is None:
+            self._index = structs.index_by_id_or_name(self)
+        return structs.first_item_by_id_or_name_indexed(self._index, key)
 
     def get(self, key: str, default: Optional[User] = None) -> Optional[User]:
         try:
@@ -168,6 +212,16 @@ class Users:
         except KeyError:
             return default
 
+    def iter_with_groups(self, max_workers: int = 4) -> Generator[Tuple[User, List[Group]], None, None]:
+        """All users together with their groups, the group lists are fetched concurrently."""
+        all_users = list(self)
+        results = self.organization.conn.get_json_many(
+            (user.endpoints["groups"] for user in all_users),
+            max_workers=max_workers,
+        )
+        for user, result in zip(all_users, results):
+            yield user, [Group.from_response(g, self.organization) for g in result.get("Item", [])]
+
     def add(self, user: User, password: Optional[str] = None) -> Optional[User]:
         headers = {
             "Content-Type": "application/vnd.docuware.platform.createorganizationuser+json"
@@ -175,7 +229,7 @@ class Users:
         try:
             body = user.as_dict()
             if "DBName" not in body:
-                body["DBName"] = body.make_db_name()
+                body["DBName"] = user.make_db_name()
             body["Password"] = password or utils.random_password()
             result = self.organization.conn.post_json(
                 self.organization.endpoints["userInfo"],
@@ -185,68 +239,58 @@ class Users:
         except Exception as exc:
             log.debug("Unable to create user %s: %s", user, exc)
             return None
-        # FIXME: Check result instead of this hack:
+        self._index = None
+        # The created user is returned by the server
+        if result and "Id" in result:
+            return User.from_response(result, self.organization)
         for item in self:
-            if item.db_name == body.db_name:
+            if item.db_name == body["DBName"]:
                 return item
         return None
 
 
 class Group:
+    __slots__ = ("name", "id", "organization", "_endpoints", "_config")
+
     def __init__(self, name: str):
         self.name = name
         self.id = None
         self.organization = None
-        self.endpoints = None
+        self._endpoints = None
+        self._config = None
 
     @staticmethod
     def from_response(response: dict, organization: types.OrganizationP):
-        g = Group(
-            name=response.get("Name")
-        )
+        g = Group.__new__(Group)
+        g.name = response.get("Name")
         g.id = response.get("Id")
-        g.endpoints = structs.Endpoints(response)
+        g._endpoints = None
+        g._config = response
         g.organization = organization
         return g
 
+    @property
+    def endpoints(self) -> Optional[structs.Endpoints]:
+        if self._endpoints is None and self._config is not None:
+            self._endpoints = structs.Endpoints(self._config)
+            self._config = None
+        return self._endpoints
+
+    @endpoints.setter
+    def endpoints(self, endpoints: Optional[structs.Endpoints]):
+        self._endpoints = endpoints
+        self._config = None
+
     @property
     def users(self) -> Generator[User, None, None]:
-        result = self.organization.client.conn.get_json(self.endpoints["users"])
+        result = self.organization.conn.get_json(self.endpoints["users"])
         return (User.from_response(u, self.organization) for u in result.get("User", []))
 
-    # FIXME: Testing needed, the endpoint looks very suspicious
     def _set_user_membership(self, user: User, include: bool):
         if not self.id:
             # FIXME: raise a better suited exception
             raise ValueError("Not a registered group")
-        if not user.id:
-            # FIXME: raise a better suited exception
-            raise ValueError("Not a registered user")
-
-        headers = {
-            "Accept": "application/json",
-            "Content-Type": "application/json"
-        }
-
-        body = {
-            "Ids": [
-                self.id
-            ],
-            "OperationType": "Add" if include else "Remove"
-        }
-
-        try:
-            result = self.organization.conn.put(
-                "/DocuWare/Platform/Organization/UserGroups",
-                headers=headers,
-                params={"UserId": user.id},
-                json=body,
-            )
-            # FIXME: check result
-        except Exception as exc:
-            log.debug("Changing group membership of user %s failed: %s", user, exc)
-            return False
-        return True
+        return _set_group_membership(self.organization, user, [self.id], include)
 
     def add_user(self, user: User) -> bool:
         return self._set_user_membership(user, include=True)
@@ -254,6 +298,20 @@ class Group:
     def remove_user(self, user: User) -> bool:
         return self._set_user_membership(user, include=False)
 
+    def _set_users_membership(self, users: Iterable[User], include: bool, max_workers: int) -> bool:
+        users = list(users)
+        if len(users) <= 1:
+            return all(self._set_user_membership(user, include) for user in users)
+        # The endpoint takes one user per request, so the requests are sent concurrently
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(users))) as executor:
+            return all(list(executor.map(lambda user: self._set_user_membership(user, include), users)))
+
+    def add_users(self, users: Iterable[User], max_workers: int = 4) -> bool:
+        return self._set_users_membership(users, include=True, max_workers=max_workers)
+
+    def remove_users(self, users: Iterable[User], max_workers: int = 4) -> bool:
+        return self._set_users_membership(users, include=False, max_workers=max_workers)
+
     def __str__(self) -> str:
         return f"{self.__class__.__name__} '{self.name}' [{self.id}]"
 
@@ -264,13 +322,16 @@ class Group:
 class Groups:
     def __init__(self, organization: types.OrganizationP):
         self.organization = organization
+        self._index: Optional[Dict[str, Group]] = None
 
     def __iter__(self):
-        result = self.organization.client.conn.get_json(self.organization.endpoints["groups"])
+        result = self.organization.conn.get_json(self.organization.endpoints["groups"])
         return (Group.from_response(group, self.organization) for group in result.get("Item", []))
 
     def __getitem__(self, key: str) -> Group:
-        return structs.first_item_by_id_or_name(self, key)
+        if self._index is None:
+            self._index = structs.index_by_id_or_name(self)
+        return structs.first_item_by_id_or_name_indexed(self._index, key)
 
     def get(self, key: str, default: Optional[Group] = None) -> Optional[Group]:
         try:
@@ -278,4 +339,43 @@ class Groups:
         except KeyError:
             return default
 
+
+def _group_ids(groups: Iterable[Group]) -> List[str]:
+    ids = []
+    for group in groups:
+        if not group.id:
+            raise errors.UserOrGroupError(f"Not a registered group: {group}")
+        ids.append(group.id)
+    return ids
+
+
+# FIXME: Testing needed, the endpoint looks very suspicious
+def _set_group_membership(organization: types.OrganizationP, user: User, group_ids: List[str], include: bool) -> bool:
+    if not user.id:
+        # FIXME: raise a better suited exception
+        raise ValueError("Not a registered user")
+
+    headers = {
+        "Accept": "application/json",
+        "Content-Type": "application/json"
+    }
+
+    body = {
+        "Ids": group_ids,
+        "OperationType": "Add" if include else "Remove"
+    }
+
+    try:
+        result = organization.conn.put(
+            "/DocuWare/Platform/Organization/UserGroups",
+            headers=headers,
+            params={"UserId": user.id},
+            json=body,
+        )
+        # FIXME: check result
+    except Exception as exc:
+        log.debug("Changing group membership of user %s failed: %s", user, exc)
+        return False
+    return True
+
 # vim: set et sw=4 ts=4:
@@ -1,7 +1,10 @@
 from __future__ import annotations
+import functools
+import os
 import pathlib
-import random
 import re
+import secrets
+import sys
 from datetime import datetime, date
 from typing import Union, Optional
 
@@ -10,6 +13,21 @@ from docuware import errors, cidict
 DATE_PATTERN = re.compile(r"/Date\((\d+)\)/")
 
 
+def _msec_from_string(value: str) -> int:
+    if m := DATE_PATTERN.match(value if type(value) is str else str(value)):
+        return int(m[1])
+    raise errors.DataError(f"Value must be formatted like '/Date(...)/', found '{value}'")
+
+
+@functools.lru_cache(maxsize=4096)
+def _datetime_from_msec(msec: int) -> Optional[datetime]:
+    # Bulk data tends to repeat the same timestamps, the conversion is the expensive part
+    try:
+        return datetime.fromtimestamp(msec / 1000)
+    except (OverflowError, OSError, ValueError):
+        return None
+
+
 def datetime_from_string(value: str, auto_date: bool = False) -> Union[date, datetime, None]:
     """
     NB: Dates earlier than 1970 and later than 2038 break the code, and not just
@@ -19,22 +37,18 @@ def datetime_from_string(value: str, auto_date: bool = False) -> Union[date, dat
     example: 3023-01-01
     """
     if value:
-        if m := DATE_PATTERN.match(str(value)):
-            msec = int(m[1])
-            if msec > 0:
-                unix_timestamp = msec / 1000
-                try:
-                    dt = datetime.fromtimestamp(unix_timestamp)
-                except:
-                    dt = None
-                if auto_date:
-                    if dt.hour == 0 and dt.minute == 0 and dt.second == 0 and dt.microsecond == 0:
-                        return date(dt.year, dt.month, dt.day)
-                return dt
-            else:
-                # WTF: negative timestamps ... ?!
+        msec = _msec_from_string(value)
+        if msec > 0:
+            dt = _datetime_from_msec(msec)
+            if dt is None:
                 return None
-        raise errors.DataError(f"Value must be formatted like '/Date(...)/', found '{value}'")
+            if auto_date:
+                if dt.hour == 0 and dt.minute == 0 and dt.second == 0 and dt.microsecond == 0:
+                    return date(dt.year, dt.month, dt.day)
+            return dt
+        else:
+            # WTF: negative timestamps ... ?!
+            return None
     else:
         return None
 
@@ -48,18 +62,12 @@ def date_from_string(value: str) -> Optional[date]:
     example: 3023-01-01
     """
     if value:
-        if m := DATE_PATTERN.match(str(value)):
-            msec = int(m[1])
-            if msec > 0:
-                unix_timestamp = msec / 1000
-                try:
-                    dt = date.fromtimestamp(unix_timestamp)
-                except:
-                    dt = None
-                return dt
-            else:
-                return None
-        raise errors.DataError(f"Value must be formatted like '/Date(...)/', found '{value}'")
+        msec = _msec_from_string(value)
+        if msec > 0:
+            dt = _datetime_from_msec(msec)
+            return dt.date() if dt is not None else None
+        else:
+            return None
     else:
         return None
 
@@ -72,6 +80,11 @@ def date_to_string(value: date) -> str:
     return datetime_to_string(datetime(value.year, value.month, value.day))
 
 
+def intern_str(value: Optional[str]) -> Optional[str]:
+    """Intern short, frequently repeated strings like content types, empty values are returned as is."""
+    return sys.intern(value) if value else value
+
+
 def unique_filename(path: Union[str, pathlib.Path]) -> pathlib.Path:
     """
     Make a filename unique. If the file already exists, a "(1)" will be appended to the
@@ -80,16 +93,23 @@ def unique_filename(path: Union[str, pathlib.Path]) -> pathlib.Path:
     InternalError exception will be raised.
     """
     path = pathlib.Path(path)
-    stem = path.parent / path.stem
+    # One directory listing instead of a stat() call per candidate. Names are compared
+    # casefolded to be on the safe side on case-insensitive file systems.
+    try:
+        with os.scandir(path.parent) as entries:
+            existing = {entry.name.casefold() for entry in entries}
+    except FileNotFoundError:
+        return path
+    stem = path.stem
     suffix = path.suffix
     n = 0
-    candidate = path
-    while candidate.exists():
+    name = path.name
+    while name.casefold() in existing:
         n += 1
         if n > 1000:
             raise errors.InternalError(f"Unable to create file {path}: too many duplicates")
-        candidate = pathlib.Path(f"{stem}({n}){suffix}")
-    return candidate
+        name = f"{stem}({n}){suffix}"
+    return path.with_name(name) if n else path
 
 
 def write_binary_file(blob: bytes, path: Union[str, pathlib.Path]):
@@ -98,7 +118,10 @@ def write_binary_file(blob: bytes, path: Union[str, pathlib.Path]):
         f.write(blob)
 
 
+_PASSWORD_ALPHABET = "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ.,;:-_/+="
+
+
 def random_password(length: int = 16) -> str:
-    return "".join(random.choices("0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ.,;:-_/+=", k=length))
+    return "".join(secrets.choice(_PASSWORD_ALPHABET) for _ in range(length))
 
 # vim: set et sw=4 ts=4:
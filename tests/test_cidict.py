@@ -0,0 +1,26 @@
+import unittest
+
+from docuware import cidict, cijson
+
+
+class CaseInsensitiveDictTests(unittest.TestCase):
+
+    def test_from_dict(self):
+        d = cidict.CaseInsensitiveDict.from_dict({"Name": "A", "Id": 1})
+        self.assertEqual(d, cidict.CaseInsensitiveDict({"name": "A", "ID": 1}))
+        self.assertEqual(d["NAME"], "A")
+        self.assertEqual(list(d.keys()), ["Name", "Id"])
+
+    def test_from_pairs(self):
+        d = cidict.CaseInsensitiveDict.from_pairs([("Name", "A"), ("NAME", "B")])
+        self.assertEqual(len(d), 1)
+        self.assertEqual(d["name"], "B")
+
+    def test_json_hook(self):
+        d = cijson.loads('{"Dialog": [{"FileCabinetId": "X"}]}')
+        self.assertIsInstance(d, cidict.CaseInsensitiveDict)
+        self.assertEqual(d["dialog"][0]["fileCabinetID"], "X")
+
+
+if __name__ == "__main__":
+    unittest.main()
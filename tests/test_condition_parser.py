@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from datetime import datetime
+
 import pytest
 
-from docuware import client, dialogs, filecabinet, organization
+from docuware import client, dialogs, errors, filecabinet, organization, utils
 
 def _search_fields(dlg: dialogs.SearchDialog) -> dict:
     SAMPLE_FIELDS = [
@@ -12,20 +14,24 @@ def _search_fields(dlg: dialogs.SearchDialog) -> dict:
     fields = [dialogs.SearchField(item, dlg) for item in SAMPLE_FIELDS]
     return {f.name:f for f in fields}
 
-def _search_dialog() -> dialogs.SearchDialog:
-    dw = client.DocuwareClient("http://localhost")
+def _search_dialog(dw: client.DocuwareClient) -> dialogs.SearchDialog:
     org = organization.Organization({}, dw)
     dlg = dialogs.SearchDialog({}, filecabinet.FileCabinet({}, org))
     dlg._fields = _search_fields(dlg)
     return dlg
 
+@pytest.fixture(scope="module")
+def dw_client() -> client.DocuwareClient:
+    # The client is never logged in or modified, one per module is enough
+    return client.DocuwareClient("http://localhost")
+
 @pytest.fixture
-def search_dialog() -> dialogs.SearchDialog:
-    return _search_dialog()
+def search_dialog(dw_client) -> dialogs.SearchDialog:
+    return _search_dialog(dw_client)
 
 @pytest.fixture
-def condition_parser() -> dialogs.ConditionParser:
-    sd = _search_dialog()
+def condition_parser(dw_client) -> dialogs.ConditionParser:
+    sd = _search_dialog(dw_client)
     cp = dialogs.ConditionParser(sd)
     return cp
 
@@ -40,3 +46,22 @@ def test_condition_parser_list_str(condition_parser):
 def test_condition_parser_dict_str(condition_parser):
     assert condition_parser.parse({'FIELD1': '123'}) == [('FIELD1', ['123'])]
     assert condition_parser.parse({'FIELD1': ['123', '234'], 'FIELD2': '456'}) == [('FIELD1', ['123', '234']), ('FIELD2', ['456'])]
+
+def test_condition_parser_field_by_name(condition_parser):
+    assert condition_parser.field_by_name('testfield.1').id == 'FIELD1'
+    assert condition_parser.field_by_name('field2').id == 'FIELD2'
+    with pytest.raises(errors.SearchConditionError):
+        condition_parser.field_by_name('FIELD3')
+
+def test_condition_parser_convert_field_value():
+    assert dialogs.ConditionParser.convert_field_value(None) == "*"
+    assert dialogs.ConditionParser.convert_field_value(42) == "42"
+    dt = datetime(2022, 3, 5, 13, 37, 24)
+    assert dialogs.ConditionParser.convert_field_value(dt) == utils.datetime_to_string(dt)
+    assert dialogs.ConditionParser.convert_field_value(dt.date()) == utils.date_to_string(dt.date())
+
+def test_condition_parser_dict_values(condition_parser):
+    assert condition_parser.parse({'FIELD2': 123}) == [('FIELD2', ['123'])]
+    assert condition_parser.parse({'FIELD2': (1, None)}) == [('FIELD2', ['1', '*'])]
+    assert condition_parser.parse({'FIELD2': {7}}) == [('FIELD2', ['7'])]
+    assert condition_parser.parse({'FIELD2': (i for i in (1, 2))}) == [('FIELD2', ['1', '2'])]
@@ -0,0 +1,51 @@
+import unittest
+
+from docuware import conn
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, etag: str = None):
+        self.status_code = status_code
+        self.headers = {"ETag": etag} if etag else {}
+
+    def json(self, object_pairs_hook=None):
+        return {"Dialog": []}
+
+
+class ConnectionTests(unittest.TestCase):
+
+    def test_make_url(self):
+        c = conn.Connection("http://localhost/")
+        self.assertEqual(c.make_url("/DocuWare/Platform"), "http://localhost/DocuWare/Platform")
+        self.assertEqual(c.make_url("https://example.com/a"), "https://example.com/a")
+        self.assertEqual(c.make_url("/a?x=1", {"b": "c d"}), "http://localhost/a?x=1&b=c+d")
+
+    def test_get_json_etag(self):
+        c = conn.Connection("http://localhost/")
+        sent = []
+
+        def fake_get(url, headers=None, data=None):
+            etag = headers.get("If-None-Match")
+            sent.append(etag)
+            return FakeResponse(304) if etag else FakeResponse(200, etag='"v1"')
+
+        c._get = fake_get
+        first = c.get_json("/dialogs", cache=True)
+        second = c.get_json("/dialogs", cache=True)
+        self.assertIs(first, second)
+        self.assertEqual(sent, [None, '"v1"'])
+        c.clear_cache()
+        c.get_json("/dialogs", cache=True)
+        self.assertEqual(sent, [None, '"v1"', None])
+
+    def test_etag_cache_size(self):
+        c = conn.Connection("http://localhost/")
+        c._get = lambda url, headers=None, data=None: FakeResponse(200, etag='"v1"')
+        for i in range(conn._ETAG_CACHE_SIZE + 1):
+            c.get_json(f"/dialogs/{i}", cache=True)
+        self.assertEqual(len(c._etag_cache), conn._ETAG_CACHE_SIZE)
+        self.assertNotIn("http://localhost/dialogs/0", c._etag_cache)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,8 @@
 import unittest
 
-from datetime import datetime, date
+from datetime import datetime, date, timedelta, timezone
 
-from docuware import utils
+from docuware import errors, fields, utils
 
 
 class DateTimeTests(unittest.TestCase):
@@ -20,3 +20,16 @@ class DateTimeTests(unittest.TestCase):
         self.assertEqual(utils.date_to_string(self.DATE_1), self.DATE_1_STR)
         self.assertEqual(utils.date_from_string(self.DATE_1_STR), self.DATE_1)
 
+    def test_out_of_range(self):
+        self.assertIsNone(utils.datetime_from_string("/Date(99999999999999999)/"))
+        self.assertIsNone(utils.datetime_from_string("/Date(99999999999999999)/", auto_date=True))
+        self.assertIsNone(utils.date_from_string("/Date(99999999999999999)/"))
+        self.assertRaises(errors.DataError, utils.datetime_from_string, "2022-03-05")
+
+    def test_field_value_iso(self):
+        f = fields.FieldValue.from_config({"ItemElementName": "DateTime", "Item": "2022-03-05T13:37:24.5+01:00"})
+        self.assertEqual(f.value, datetime(2022, 3, 5, 13, 37, 24, 500000, tzinfo=timezone(timedelta(hours=1))))
+        f = fields.FieldValue.from_config({"ItemElementName": "Date", "Item": "2022-03-05"})
+        self.assertEqual(f.value, self.DATE_1)
+        f = fields.FieldValue.from_config({"ItemElementName": "Date", "Item": utils.date_to_string(self.DATE_1)})
+        self.assertEqual(f.value, self.DATE_1)
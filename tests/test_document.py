@@ -0,0 +1,100 @@
+import threading
+import unittest
+from types import SimpleNamespace
+
+from docuware import document, fields
+
+
+class DocumentTests(unittest.TestCase):
+
+    DOCUMENT_DATA = {
+        "Id": 42,
+        "Title": "Invoice",
+        "Fields": [
+            {"FieldName": "DOCNO", "FieldLabel": "Document number", "ItemElementName": "String", "Item": "123456"},
+            {"FieldName": "AMOUNT", "FieldLabel": "DocNo", "ItemElementName": "Decimal", "Item": 9.5},
+        ],
+        "Sections": [
+            {"Id": "1-1", "OriginalFileName": "invoice.pdf", "ContentType": "application/pdf"},
+        ],
+        "Links": [
+            {"rel": "self", "href": "/DocuWare/Platform/FileCabinets/A/Documents/42"},
+        ],
+    }
+
+    def test_field(self):
+        doc = document.Document(self.DOCUMENT_DATA, None)
+        self.assertEqual(doc.field("DOCNO").value, "123456")
+        self.assertEqual(doc.field("docno").value, "123456")
+        self.assertEqual(doc.field("Document Number").value, "123456")
+        self.assertEqual(doc.field("amount").value, 9.5)
+        self.assertIsNone(doc.field("nothingHere", None))
+        self.assertRaises(KeyError, doc.field, "nothingHere")
+
+    def test_keywords_field(self):
+        def keywords(item):
+            return fields.FieldValue.from_config(
+                {"FieldName": "TAGS", "ItemElementName": "Keywords", "Item": item}
+            ).value
+
+        self.assertEqual(keywords({"Keyword": ["a", "b"]}), ["a", "b"])
+        self.assertIsNone(keywords({"Keyword": []}))
+        self.assertIsNone(keywords({}))
+        self.assertIsNone(keywords(None))
+
+    def test_attachments_and_endpoints(self):
+        doc = document.Document(self.DOCUMENT_DATA, None)
+        self.assertEqual(doc.endpoints["SELF"], "/DocuWare/Platform/FileCabinets/A/Documents/42")
+        self.assertEqual([att.filename for att in doc.attachments], ["invoice.pdf"])
+        self.assertIs(doc.attachments[0].document, doc)
+        doc.endpoints = {}
+        self.assertNotIn("self", doc.endpoints)
+
+    def test_prefetch_endpoints(self):
+        responses = {
+            "/s/2": {"Links": [{"rel": "fileDownload", "href": "/s/2/download"}]},
+            "/s/3": {"Links": [{"rel": "fileDownload", "href": "/s/3/download"}]},
+        }
+        requested = []
+
+        def get_json_many(paths):
+            paths = list(paths)
+            requested.extend(paths)
+            return [responses[path] for path in paths]
+
+        fc = SimpleNamespace(organization=SimpleNamespace(client=SimpleNamespace(
+            conn=SimpleNamespace(get_json_many=get_json_many))))
+        doc = document.Document({"Sections": [
+            {"Id": "1", "Links": [{"rel": "self", "href": "/s/1"}, {"rel": "fileDownload", "href": "/s/1/download"}]},
+            {"Id": "2", "Links": [{"rel": "self", "href": "/s/2"}]},
+            {"Id": "3", "Links": [{"rel": "self", "href": "/s/3"}]},
+        ]}, fc)
+        document.DocumentAttachment.prefetch_endpoints(doc.attachments)
+        self.assertEqual(requested, ["/s/2", "/s/3"])
+        self.assertEqual([att.endpoints["fileDownload"] for att in doc.attachments],
+                         ["/s/1/download", "/s/2/download", "/s/3/download"])
+        document.DocumentAttachment.prefetch_endpoints(doc.attachments)
+        self.assertEqual(len(requested), 2)
+
+    def test_bulk_download_stopped_early(self):
+        release = threading.Event()
+        started = []
+
+        def make_doc(name):
+            def download(keep_annotations=True):
+                started.append(name)
+                if name != "a":
+                    release.wait(5)
+                return name.encode(), "text/plain", name
+            return SimpleNamespace(download=download)
+
+        docs = [make_doc(name) for name in "abc"]
+        downloads = document.bulk_download(docs, workers=1)
+        self.assertEqual(next(downloads)[1][2], "a")
+        downloads.close()
+        self.assertNotIn("c", started)
+        release.set()
+
+
+if __name__ == "__main__":
+    unittest.main()
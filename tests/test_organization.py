@@ -0,0 +1,84 @@
+import unittest
+
+from docuware import errors, filecabinet, organization
+
+
+class RecordingConnection:
+    RESPONSES = {
+        "/fc": {"FileCabinet": [
+            {"Id": "a1", "Name": "Archive", "Links": [{"rel": "dialogs", "href": "/fc/a1/dialogs"}]},
+            {"Id": "b2", "Name": "Inbox", "Links": [{"rel": "dialogs", "href": "/fc/b2/dialogs"}]},
+        ]},
+        "/fc/a1/dialogs": {"Dialog": [{"$type": "DialogInfo", "Type": "Search", "Id": "d3", "DisplayName": "Find"}]},
+        "/fc/b2/dialogs": {"Dialog": []},
+        "/dialogs": {"Dialog": [
+            {"$type": "DialogInfo", "Type": "Search", "Id": "d1", "DisplayName": "Search", "FileCabinetId": "b2"},
+            {"$type": "DialogInfo", "Type": "Search", "Id": "d2", "DisplayName": "Orphan", "FileCabinetId": "zz"},
+        ]},
+    }
+
+    def __init__(self):
+        self.requests = []
+        self.failing = set()
+
+    def get_json(self, path: str, cache: bool = False) -> dict:
+        self.requests.append(path)
+        if path in self.failing:
+            raise errors.ResourceError("GET request failed with code 500", url=path, status_code=500)
+        return self.RESPONSES[path]
+
+    def get_json_many(self, paths, headers=None, max_workers=4, cache=False):
+        return [self.get_json(path, cache=cache) for path in paths]
+
+
+class Client:
+    def __init__(self):
+        self.conn = RecordingConnection()
+
+
+class OrganizationTests(unittest.TestCase):
+
+    def setUp(self):
+        self.client = Client()
+        self.org = organization.Organization({
+            "Name": "Org",
+            "Id": "1",
+            "Links": [{"rel": "filecabinets", "href": "/fc"}, {"rel": "dialogs", "href": "/dialogs"}],
+        }, self.client)
+
+    def test_file_cabinet(self):
+        self.assertEqual(self.org.file_cabinet("archive").id, "a1")
+        self.assertEqual(self.org.file_cabinet("B2").name, "Inbox")
+        self.assertIsNone(self.org.file_cabinet("missing", None))
+        with self.assertRaises(KeyError):
+            self.org.file_cabinet("missing")
+        self.assertIs(self.org.file_cabinet("a1"), self.org.file_cabinets[0])
+        self.assertEqual(self.client.conn.requests, ["/fc"])
+
+    def test_dialog(self):
+        dlg = self.org.dialog("search")
+        self.assertEqual(dlg.id, "d1")
+        self.assertIs(dlg.file_cabinet, self.org.file_cabinet("Inbox"))
+        self.assertIsNone(self.org.dialog("Orphan", None))
+        self.assertEqual(self.client.conn.requests, ["/fc", "/dialogs"])
+
+    def test_dialogs_after_failed_request(self):
+        self.client.conn.failing.add("/dialogs")
+        with self.assertRaises(errors.ResourceError):
+            _ = self.org.dialogs
+        self.client.conn.failing.clear()
+        self.assertEqual([dlg.id for dlg in self.org.dialogs], ["d1"])
+        self.assertEqual(self.org.dialog("search").id, "d1")
+
+    def test_prefetch_dialogs(self):
+        cabinets = self.org.file_cabinets
+        filecabinet.FileCabinet.prefetch_dialogs(cabinets)
+        self.assertEqual(self.client.conn.requests, ["/fc", "/fc/a1/dialogs", "/fc/b2/dialogs"])
+        self.assertEqual(cabinets[0].search_dialog("find").id, "d3")
+        self.assertEqual(cabinets[1].dialogs, [])
+        filecabinet.FileCabinet.prefetch_dialogs(cabinets)
+        self.assertEqual(len(self.client.conn.requests), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
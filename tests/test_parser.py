@@ -26,6 +26,27 @@ class ParserTests(unittest.TestCase):
         self.assertEqual(r.getch(), "Ä")
         self.assertEqual(r.getch(), "ÖÜ")
 
+    CD_CASES = [
+        (CD_OK_1, {"Type": "form-data", "NAME": "fieldName"}),
+        (CD_OK_3, {"type": "form-data", "name": "fieldName", "filename": "filename.jpg"}),
+        (CD_OK_4, {"type": "form-data", "name": "fieldName", "filename": "filename.jpg"}),
+        (CD_OK_5, {"type": "form-data", "name": "name1; name2", "filename": "filename.jpg"}),
+        (CD_OK_6, {"type": "form-data", "name": "", "filename": "filename.jpg"}),
+        (CD_ERR_1, {"name": "Name", "filename": "filename.jpg"}),
+        (CD_ERR_2, {"type": "form-data", "name": ""}),
+    ]
+
+    CONDITION_CASES = [
+        ("keyword=test", ("keyword", ["test"])),
+        (" keyword = test ", ("keyword", ["test"])),
+        ("keyword=test1,test2", ("keyword", ["test1", "test2"])),
+        ('keyword="test 1",test2', ("keyword", ["test 1", "test2"])),
+        ('keyword=test1,"test 2"', ("keyword", ["test1", "test 2"])),
+        ('keyword="test 1","test 2"', ("keyword", ["test 1", "test 2"])),
+        ('keyword = "test 1" , "test 2"', ("keyword", ["test 1", "test 2"])),
+        ('keyword = "test\\" 1" , " test 2 "', ("keyword", ["test\" 1", " test 2 "])),
+    ]
+
     def test_content_disposition(self):
         cd = parser.parse_content_disposition("", case_insensitive=False)
         self.assertEqual(cd, {})
@@ -33,54 +54,22 @@ class ParserTests(unittest.TestCase):
         self.assertEqual(cd, {})
         cd = parser.parse_content_disposition(self.CD_OK_1)
         self.assertIsInstance(cd, cidict.CaseInsensitiveDict)
-        self.assertEqual(cd.get("Type"), "form-data")
-        self.assertEqual(cd.get("NAME"), "fieldName")
         cd = parser.parse_content_disposition(self.CD_OK_2, case_insensitive=False)
         self.assertIsInstance(cd, dict)
         self.assertEqual(cd.get("type"), "form-data")
         self.assertEqual(cd.get("name"), "fieldName")
         self.assertEqual(cd.get("filename"), "filename.jpg")
-        cd = parser.parse_content_disposition(self.CD_OK_3)
-        self.assertEqual(cd.get("type"), "form-data")
-        self.assertEqual(cd.get("name"), "fieldName")
-        self.assertEqual(cd.get("filename"), "filename.jpg")
-        cd = parser.parse_content_disposition(self.CD_OK_4)
-        self.assertEqual(cd.get("type"), "form-data")
-        self.assertEqual(cd.get("name"), "fieldName")
-        self.assertEqual(cd.get("filename"), "filename.jpg")
-        cd = parser.parse_content_disposition(self.CD_OK_5)
-        self.assertEqual(cd.get("type"), "form-data")
-        self.assertEqual(cd.get("name"), "name1; name2")
-        self.assertEqual(cd.get("filename"), "filename.jpg")
-        cd = parser.parse_content_disposition(self.CD_OK_6)
-        self.assertEqual(cd.get("type"), "form-data")
-        self.assertEqual(cd.get("name"), "")
-        self.assertEqual(cd.get("filename"), "filename.jpg")
-        cd = parser.parse_content_disposition(self.CD_ERR_1)
-        self.assertEqual(cd.get("name"), "Name")
-        self.assertEqual(cd.get("filename"), "filename.jpg")
-        cd = parser.parse_content_disposition(self.CD_ERR_2)
-        self.assertEqual(cd.get("type"), "form-data")
-        self.assertEqual(cd.get("name"), "")
+        for raw, expected in self.CD_CASES:
+            with self.subTest(raw=raw):
+                cd = parser.parse_content_disposition(raw)
+                for key, value in expected.items():
+                    self.assertEqual(cd.get(key), value)
         self.assertRaises(ValueError, parser.parse_content_disposition, self.CD_EXC_1)
 
     def test_condition_parser(self):
-        sc = parser.parse_search_condition("keyword=test")
-        self.assertEqual(sc, ("keyword", ["test"]))
-        sc = parser.parse_search_condition(" keyword = test ")
-        self.assertEqual(sc, ("keyword", ["test"]))
-        sc = parser.parse_search_condition("keyword=test1,test2")
-        self.assertEqual(sc, ("keyword", ["test1", "test2"]))
-        sc = parser.parse_search_condition('keyword="test 1",test2')
-        self.assertEqual(sc, ("keyword", ["test 1", "test2"]))
-        sc = parser.parse_search_condition('keyword=test1,"test 2"')
-        self.assertEqual(sc, ("keyword", ["test1", "test 2"]))
-        sc = parser.parse_search_condition('keyword="test 1","test 2"')
-        self.assertEqual(sc, ("keyword", ["test 1", "test 2"]))
-        sc = parser.parse_search_condition('keyword = "test 1" , "test 2"')
-        self.assertEqual(sc, ("keyword", ["test 1", "test 2"]))
-        sc = parser.parse_search_condition('keyword = "test\\" 1" , " test 2 "')
-        self.assertEqual(sc, ("keyword", ["test\" 1", " test 2 "]))
+        for raw, expected in self.CONDITION_CASES:
+            with self.subTest(raw=raw):
+                self.assertEqual(parser.parse_search_condition(raw), expected)
 
     def test_condition_parser_edgecases(self):
         sc = parser.parse_search_condition("keyword")
@@ -0,0 +1,127 @@
+import unittest
+from types import SimpleNamespace
+
+from docuware import client, dialogs, filecabinet, organization
+
+
+class PagedConnection:
+    """Serves result pages '/0' ... '/<last>', each with a single item."""
+
+    def __init__(self, last: int):
+        self.last = last
+        self.requests = []
+
+    def get_json(self, path: str) -> dict:
+        self.requests.append(path)
+        page = int(path[1:])
+        result = {"Items": [{"Title": f"Item {page}"}]}
+        if page < self.last:
+            result["Links"] = [{"rel": "next", "href": f"/{page + 1}"}]
+        return result
+
+
+class PagedQuery:
+    def __init__(self, conn: PagedConnection):
+        self.conn = conn
+
+
+class SearchResultTests(unittest.TestCase):
+
+    def test_pagination(self):
+        conn = PagedConnection(last=3)
+        result = dialogs.SearchResult(conn.get_json("/0"), PagedQuery(conn))
+        self.assertEqual(next(result).title, "Item 0")
+        self.assertEqual([item.title for item in result], ["Item 1", "Item 2", "Item 3"])
+        self.assertEqual(list(result), [])
+        self.assertEqual(conn.requests, ["/0", "/1", "/2", "/3"])
+
+    def test_no_prefetch_before_iteration(self):
+        conn = PagedConnection(last=3)
+        result = dialogs.SearchResult(conn.get_json("/0"), PagedQuery(conn))
+        iter(result)
+        self.assertEqual(conn.requests, ["/0"])
+
+    def test_single_page(self):
+        conn = PagedConnection(last=0)
+        result = dialogs.SearchResult(conn.get_json("/0"), PagedQuery(conn))
+        self.assertEqual([item.title for item in result], ["Item 0"])
+
+
+class SearchDialogLookupTests(unittest.TestCase):
+
+    DIALOGS = [
+        {"$type": "DialogInfo", "Type": "Store", "Id": "1", "DisplayName": "Store"},
+        {"$type": "DialogInfo", "Type": "Search", "Id": "2", "DisplayName": "Default"},
+        {"$type": "DialogInfo", "Type": "Search", "Id": "3", "DisplayName": "Special"},
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        # Client and organization are not modified by the tests
+        cls.org = organization.Organization({}, client.DocuwareClient("http://localhost"))
+
+    def setUp(self):
+        # File cabinets cache their dialog indexes, so every test gets its own
+        self.fc = filecabinet.FileCabinet({}, self.org)
+        self.fc._dialogs = [dialogs.Dialog.from_config(dlg, self.fc) for dlg in self.DIALOGS]
+
+    def test_search_dialog(self):
+        self.assertEqual(self.fc.search_dialog().id, "2")
+        self.assertEqual(self.fc.search_dialog("special").id, "3")
+        self.assertEqual(self.fc.search_dialog("3").id, "3")
+        self.assertIsNone(self.fc.search_dialog("Store", None))
+        self.assertRaises(KeyError, self.fc.search_dialog, "Store")
+
+    def test_dialog(self):
+        self.assertIsInstance(self.fc.dialog("store"), dialogs.StoreDialog)
+        self.assertEqual(self.fc.dialog("2").name, "Default")
+        self.assertIsNone(self.fc.dialog("nothingHere", None))
+        self.assertRaises(KeyError, self.fc.dialog, "nothingHere")
+
+
+class SearchFieldValuesTests(unittest.TestCase):
+
+    RESPONSES = {
+        "/a": {"Value": ["x"]},
+        "/c": {"Value": ["y", "z"]},
+    }
+
+    def setUp(self):
+        self.requests = []
+        conn = SimpleNamespace(get_json=self.get_json, get_json_many=self.get_json_many)
+        fc = SimpleNamespace(organization=SimpleNamespace(client=SimpleNamespace(conn=conn)))
+        self.dlg = dialogs.SearchDialog({}, fc)
+        self.dlg._fields = {
+            f["DBFieldName"]: dialogs.SearchField(f, self.dlg) for f in [
+                {"DBFieldName": "A", "Links": [{"rel": "simpleSelectList", "href": "/a"}]},
+                {"DBFieldName": "B"},
+                {"DBFieldName": "C", "Links": [{"rel": "simpleSelectList", "href": "/c"}]},
+            ]
+        }
+
+    def get_json(self, path):
+        self.requests.append(path)
+        return self.RESPONSES[path]
+
+    def get_json_many(self, paths):
+        return [self.get_json(path) for path in paths]
+
+    def test_prefetch_field_values(self):
+        self.dlg.prefetch_field_values()
+        self.assertEqual(self.requests, ["/a", "/c"])
+        fields = self.dlg.fields
+        self.assertEqual(fields["A"].values(), ["x"])
+        self.assertEqual(fields["B"].values(), [])
+        self.assertEqual(fields["C"].values(), ["y", "z"])
+        self.assertEqual(self.requests, ["/a", "/c"])
+
+    def test_values(self):
+        field = self.dlg.fields["C"]
+        field.values().append("changed")
+        self.assertEqual(field.values(), ["y", "z"])
+        self.assertEqual(field.values(refresh=True), ["y", "z"])
+        self.assertEqual(self.requests, ["/c", "/c"])
+
+
+if __name__ == "__main__":
+    unittest.main()
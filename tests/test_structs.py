@@ -1,6 +1,7 @@
 import unittest
+from types import SimpleNamespace
 
-from docuware.structs import ResourcePattern, Endpoints
+from docuware.structs import ResourcePattern, Endpoints, first_item_by_id_or_name, first_item_by_id_or_name_indexed, index_by_id_or_name
 from docuware.errors import InternalError
 
 
@@ -13,7 +14,7 @@ class StructTests(unittest.TestCase):
         p = ResourcePattern({"Name": name, "UriPattern": pattern,})
         self.assertEqual(p.name, name)
         self.assertEqual(p.pattern, pattern)
-        self.assertEqual(p.fields, ["fcId", "dlgId", "dlgType"])
+        self.assertEqual(p.fields, ("fcId", "dlgId", "dlgType"))
         self.assertEqual(p.apply({"dlgId": "B", "fcId": "A", "dlgType": "C"}), url)
         self.assertRaises(InternalError, p.apply, {"dlgId": "B", "dlgType": "C"}, strict=True)
         self.assertRaises(InternalError, p.apply, {"fcId": "A", "dlgId": "B", "dlgType": "C", "error": "D"}, strict=True)
@@ -51,6 +52,28 @@ class StructTests(unittest.TestCase):
         self.assertEqual(ep.get("nothingHere", "ABC"), "ABC")
         self.assertRaises(KeyError, ep.__getitem__, "nothingHere")
 
+    def test_index_by_id_or_name(self):
+        a = SimpleNamespace(id="A", name="b")
+        b = SimpleNamespace(id="B", name="Second")
+        index = index_by_id_or_name([a, b])
+        self.assertIs(index["a"], a)
+        self.assertIs(index["b"], b)
+        self.assertIs(index["second"], b)
+        self.assertIs(first_item_by_id_or_name_indexed(index, "SECOND"), b)
+        self.assertIsNone(first_item_by_id_or_name_indexed(index, "nothingHere", None))
+        self.assertRaises(KeyError, first_item_by_id_or_name_indexed, index, "nothingHere")
+
+    def test_first_item_by_id_or_name(self):
+        a = SimpleNamespace(id="A", name="Straße")
+        b = SimpleNamespace(id="B", name="Second")
+        self.assertIs(first_item_by_id_or_name([a, b], "STRASSE"), a)
+        self.assertIs(first_item_by_id_or_name([a, b], "second"), b)
+        self.assertIs(first_item_by_id_or_name([a, b], "B"), b)
+        b.name = "Renamed"
+        self.assertIsNone(first_item_by_id_or_name([a, b], "second", None))
+        self.assertIs(first_item_by_id_or_name([a, b], "renamed"), b)
+        self.assertRaises(KeyError, first_item_by_id_or_name, [a, b], "nothingHere")
+
 
 if __name__ == "__main__":
     unittest.main()
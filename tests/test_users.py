@@ -1,53 +1,104 @@
 import unittest
+from types import SimpleNamespace
 
-from docuware import users
+from docuware import errors, users
 
 
 class UserAndGroupTests(unittest.TestCase):
 
-    def test_user_full_name_1(self):
-        u = users.User("John Doe")
-        self.assertEqual(u.name, "John Doe")
-        self.assertEqual(u.last_name, "Doe")
-        self.assertEqual(u.first_name, "John")
+    # User arguments and the expected (name, last_name, first_name)
+    USER_CASES = [
+        (dict(name="John Doe"), ("John Doe", "Doe", "John")),
+        (dict(name="Doe, John"), ("Doe, John", "Doe", "John")),
+        (dict(name="Doe"), ("Doe", "Doe", None)),
+        (dict(first_name="John", last_name="Doe"), ("John Doe", "Doe", "John")),
+        (dict(last_name="Doe"), ("Doe", "Doe", None)),
+        (dict(first_name="foo", last_name="bar", name="John Doe"), ("John Doe", "Doe", "John")),
+    ]
 
-    def test_user_full_name_2(self):
-        u = users.User("Doe, John")
-        self.assertEqual(u.name, "Doe, John")
-        self.assertEqual(u.last_name, "Doe")
-        self.assertEqual(u.first_name, "John")
-
-    def test_user_parts_1(self):
-        u = users.User(first_name="John", last_name="Doe")
-        self.assertEqual(u.name, "John Doe")
-        self.assertEqual(u.last_name, "Doe")
-        self.assertEqual(u.first_name, "John")
-    
-    def test_user_parts_2(self):
-        u = users.User(last_name="Doe")
-        self.assertEqual(u.name, "Doe")
-        self.assertEqual(u.last_name, "Doe")
-        self.assertEqual(u.first_name, None)
-
-    def test_user_overwrite_1(self):
-        u = users.User(first_name="foo", last_name="bar", name="John Doe")
-        self.assertEqual(u.name, "John Doe")
-        self.assertEqual(u.last_name, "Doe")
-        self.assertEqual(u.first_name, "John")
+    @classmethod
+    def setUpClass(cls):
+        # Shared by the read-only tests, test_user_overwrite_2 builds its own
+        cls.user_cases = [(kwargs, users.User(**kwargs), expected) for kwargs, expected in cls.USER_CASES]
+        cls.g = users.Group(name="TestGroup")
+
+    def test_user_names(self):
+        for kwargs, u, (name, last_name, first_name) in self.user_cases:
+            with self.subTest(**kwargs):
+                self.assertTupleEqual((u.name, u.last_name, u.first_name), (name, last_name, first_name))
 
     def test_user_overwrite_2(self):
         u = users.User(name="Doe, John")
-        self.assertEqual(u.name, "Doe, John")
-        self.assertEqual(u.last_name, "Doe")
-        self.assertEqual(u.first_name, "John")
+        self.assertTupleEqual((u.name, u.last_name, u.first_name), ("Doe, John", "Doe", "John"))
         u.first_name = "Jack"
-        self.assertEqual(u.name, "Jack Doe")
-        self.assertEqual(u.last_name, "Doe")
-        self.assertEqual(u.first_name, "Jack")
+        self.assertTupleEqual((u.name, u.last_name, u.first_name), ("Jack Doe", "Doe", "Jack"))
 
     def test_group_create(self):
-        g = users.Group(name="TestGroup")
-        self.assertEqual(g.name, "TestGroup")
+        self.assertEqual(self.g.name, "TestGroup")
+
+    def test_iter_with_groups(self):
+        responses = {
+            "/users": {"User": [
+                {"Id": "1", "Name": "John Doe", "Links": [{"rel": "groups", "href": "/users/1/groups"}]},
+                {"Id": "2", "Name": "Jane Doe", "Links": [{"rel": "groups", "href": "/users/2/groups"}]},
+            ]},
+            "/users/1/groups": {"Item": [{"Id": "g1", "Name": "Staff"}]},
+            "/users/2/groups": {"Item": []},
+        }
+        conn = SimpleNamespace(get_json=lambda path, headers=None: responses[path])
+        conn.get_json_many = lambda paths, headers=None, max_workers=4: [conn.get_json(p) for p in paths]
+        org = SimpleNamespace(conn=conn, endpoints={"users": "/users"})
+        result = [(u.name, [g.name for g in groups]) for u, groups in users.Users(org).iter_with_groups()]
+        self.assertEqual(result, [("John Doe", ["Staff"]), ("Jane Doe", [])])
+
+    def test_users_lookup(self):
+        requests = []
+
+        def get_json(path, headers=None):
+            requests.append(path)
+            return {"User": [{"Id": "1", "Name": "John Doe"}, {"Id": "2", "Name": "Jane Doe"}]}
+
+        org = SimpleNamespace(conn=SimpleNamespace(get_json=get_json), endpoints={"users": "/users"})
+        all_users = users.Users(org)
+        self.assertEqual(all_users["jane doe"].id, "2")
+        self.assertEqual(all_users["1"].name, "John Doe")
+        self.assertIsNone(all_users.get("nobody"))
+        self.assertEqual(requests, ["/users"])
+
+    def test_users_add(self):
+        posted = []
+
+        def post_json(path, headers=None, json=None):
+            posted.append(json)
+            return {**json, "Id": "42"}
+
+        conn = SimpleNamespace(post_json=post_json)
+        org = SimpleNamespace(conn=conn, endpoints={"userInfo": "/userinfo"})
+        u = users.Users(org).add(users.User("Doe, John"), password="secret")
+        self.assertEqual(u.id, "42")
+        self.assertEqual(u.name, "Doe, John")
+        self.assertIs(u.organization, org)
+        self.assertEqual(posted[0]["DBName"], "DOEJOHN")
+        self.assertEqual(posted[0]["Password"], "secret")
+
+    def test_group_membership(self):
+        puts = []
+
+        def put(path, headers=None, params=None, json=None):
+            puts.append((params["UserId"], json["OperationType"], json["Ids"]))
+
+        org = SimpleNamespace(conn=SimpleNamespace(put=put))
+        john, jane = users.User("John Doe"), users.User("Jane Doe")
+        staff, admins = users.Group("Staff"), users.Group("Admins")
+        for obj, id_ in ((john, "u1"), (jane, "u2"), (staff, "g1"), (admins, "g2")):
+            obj.id, obj.organization = id_, org
+
+        self.assertTrue(john.add_to_groups([staff, admins]))
+        self.assertEqual(puts, [("u1", "Add", ["g1", "g2"])])
+        puts.clear()
+        self.assertTrue(staff.remove_users([john, jane]))
+        self.assertEqual(sorted(puts), [("u1", "Remove", ["g1"]), ("u2", "Remove", ["g1"])])
+        self.assertRaises(errors.UserOrGroupError, john.add_to_groups, [users.Group("Unregistered")])
         
 if __name__ == "__main__":
     unittest.main()
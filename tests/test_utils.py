@@ -0,0 +1,26 @@
+import pathlib
+import tempfile
+import unittest
+
+from docuware import utils
+
+
+class UniqueFilenameTests(unittest.TestCase):
+
+    def test_unique_filename(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = pathlib.Path(tmp) / "invoice.pdf"
+            self.assertEqual(utils.unique_filename(path), path)
+            path.write_bytes(b"")
+            self.assertEqual(utils.unique_filename(path).name, "invoice(1).pdf")
+            (pathlib.Path(tmp) / "invoice(1).pdf").write_bytes(b"")
+            self.assertEqual(utils.unique_filename(str(path)).name, "invoice(2).pdf")
+
+    def test_missing_directory(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = pathlib.Path(tmp) / "missing" / "invoice.pdf"
+            self.assertEqual(utils.unique_filename(path), path)
+
+
+if __name__ == "__main__":
+    unittest.main()